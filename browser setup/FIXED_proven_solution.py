@@ -8,6 +8,7 @@ import os
 import sys
 import time
 import json
+import atexit
 from pathlib import Path
 
 # Install required packages if not available
@@ -29,6 +30,35 @@ def install_packages():
 # Try to install packages
 install_packages()
 
+
+def running_in_ci():
+    """True under CI (GitHub Actions)."""
+    return bool(os.getenv('CI') or os.getenv('GITHUB_ACTIONS'))
+
+
+def wait_for_enter(prompt):
+    """Wait for ENTER, except in CI (GitHub Actions) where nobody is there to press it."""
+    if running_in_ci():
+        return
+    try:
+        input(prompt)
+    except EOFError:
+        # stdin closed (e.g. piped or detached run)
+        pass
+
+
+def exit_now_in_ci(code=0):
+    """In CI, exit immediately instead of waiting for a graceful browser shutdown.
+    
+    Only called from the script's entry point, once main() has returned and
+    everything worth keeping (e.g. the session file) is saved; the runner reaps
+    the browser processes when the job ends.
+    """
+    if running_in_ci():
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(code)
+
 try:
     import undetected_chromedriver as uc
     from selenium import webdriver
@@ -58,6 +88,23 @@ class FixedProvenSolution:
         self.state_dir.mkdir(exist_ok=True)
         self.website_name = website_name.lower().replace(" ", "_")
         self.session_file = self.state_dir / f"{self.website_name}_session.json"
+        # Persistent Playwright profile, so cookies/localStorage survive between runs
+        self.user_data_dir = self.state_dir / f"{self.website_name}_profile"
+        # Playwright driver, started on first use and kept for the object's lifetime
+        self._playwright = None
+    
+    def _get_playwright(self):
+        """Start the Playwright driver once and reuse it for every attempt."""
+        if self._playwright is None:
+            self._playwright = sync_playwright().start()
+            atexit.register(self.close)
+        return self._playwright
+    
+    def close(self):
+        """Stop the Playwright driver if it was started."""
+        if self._playwright is not None:
+            self._playwright.stop()
+            self._playwright = None
     
     def check_session_file(self):
         """Check if session file exists and is valid."""
@@ -88,6 +135,31 @@ class FixedProvenSolution:
             print(f"❌ Error reading session file: {e}")
             return False
     
+    @staticmethod
+    def _playwright_cookies(cookies):
+        """Convert saved (Selenium or Playwright) cookies to what add_cookies accepts."""
+        same_site = {'strict': 'Strict', 'lax': 'Lax', 'none': 'None'}
+        converted = []
+        for cookie in cookies:
+            if 'name' not in cookie or 'value' not in cookie or 'domain' not in cookie:
+                continue
+            pw_cookie = {
+                'name': cookie['name'],
+                'value': cookie['value'],
+                'domain': cookie['domain'],
+                'path': cookie.get('path', '/'),
+                'secure': bool(cookie.get('secure', False)),
+                'httpOnly': bool(cookie.get('httpOnly', False)),
+            }
+            # Selenium calls it 'expiry'; session cookies have neither
+            expires = cookie.get('expires', cookie.get('expiry'))
+            if expires is not None and expires >= 0:
+                pw_cookie['expires'] = expires
+            if str(cookie.get('sameSite', '')).lower() in same_site:
+                pw_cookie['sameSite'] = same_site[str(cookie['sameSite']).lower()]
+            converted.append(pw_cookie)
+        return converted
+    
     def method1_undetected_chromedriver(self, website_url, test_urls=None):
         """Method 1: Undetected ChromeDriver - Most popular working solution.
         
@@ -186,7 +258,9 @@ class FixedProvenSolution:
             
             print("🎉 SUCCESS with undetected ChromeDriver!")
             
-            driver.quit()
+            # In CI the browser is left for the runner to reap (see exit_now_in_ci)
+            if not running_in_ci():
+                driver.quit()
             return True
             
         except Exception as e:
@@ -280,8 +354,9 @@ class FixedProvenSolution:
                         print("You can now perform automated tasks on this website.")
                         print("=" * 50)
                         
-                        input("Press ENTER to close browser: ")
-                        driver.quit()
+                        wait_for_enter("Press ENTER to close browser: ")
+                        if not running_in_ci():
+                            driver.quit()
                         return True
                     else:
                         print("❌ Session expired or login required")
@@ -300,24 +375,29 @@ class FixedProvenSolution:
             else:
                 print("🥷 Using Playwright for automation...")
                 
-                with sync_playwright() as p:
-                    browser = p.chromium.launch(headless=False)
-                    
+                p = self._get_playwright()
+                browser = None
+                context = None
+                # In CI a successful run leaves the browser for the runner to reap
+                # (see exit_now_in_ci); every other exit closes it here
+                leave_open = False
+                try:
                     # Load session data
                     if 'cookies' in session_data:
-                        # Convert cookies format for Playwright
-                        context = browser.new_context()
-                        page = context.new_page()
-                        
-                        # Go to website and add cookies
-                        page.goto(website_url)
+                        # Reuse the on-disk profile; cookies carry their own domains,
+                        # so they can be added without visiting the website first
+                        context = p.chromium.launch_persistent_context(
+                            str(self.user_data_dir), headless=False
+                        )
+                        page = context.pages[0] if context.pages else context.new_page()
                         
-                        for cookie in session_data['cookies']:
-                            try:
-                                context.add_cookies([cookie])
-                            except:
-                                continue
+                        # One add_cookies call for the whole batch
+                        try:
+                            context.add_cookies(self._playwright_cookies(session_data['cookies']))
+                        except Exception as e:
+                            print(f"⚠️  Could not load saved cookies: {e}")
                     else:
+                        browser = p.chromium.launch(headless=False)
                         context = browser.new_context(storage_state=session_data)
                         page = context.new_page()
                     
@@ -330,21 +410,26 @@ class FixedProvenSolution:
                         print(f"✅ {website_name} automation ready!")
                         print("🎬 Add your automation logic here...")
                         
-                        input("Press ENTER to close browser: ")
-                        browser.close()
+                        wait_for_enter("Press ENTER to close browser: ")
+                        leave_open = running_in_ci()
                         return True
                     else:
                         print("❌ Session expired")
-                        browser.close()
                         return False
-                        
+                finally:
+                    if not leave_open:
+                        if context:
+                            context.close()
+                        if browser:
+                            browser.close()
+                    
         except Exception as e:
             print(f"❌ Automation failed: {e}")
             return False
 
 
 def main():
-    """Main function with fixed session handling."""
+    """Main function with fixed session handling. Returns the exit code."""
     print("=" * 70)
     print("🥷 UNIVERSAL BROWSER SESSION MANAGER")
     print("=" * 70)
@@ -396,16 +481,21 @@ def main():
     
     elif choice == "3":
         print("\n🔍 Checking session status...")
-        if solution.check_session_file():
+        success = solution.check_session_file()
+        if success:
             print("✅ Session file is valid and ready for automation!")
         else:
             print("❌ No valid session found. Run option 1 first.")
     
     else:
         print("Invalid choice!")
+        success = False
     
-    input("\nPress ENTER to exit...")
+    wait_for_enter("\nPress ENTER to exit...")
+    return 0 if success else 1
 
 
 if __name__ == "__main__":
-    main()
+    exit_code = main()
+    exit_now_in_ci(exit_code)
+    sys.exit(exit_code)
@@ -4,9 +4,44 @@ Extract Secrets for GitHub Actions
 Helps you copy the content of credential files to create GitHub Secrets
 """
 
+import sys
 import json
+import argparse
 from pathlib import Path
 
+# Optional: faster JSON validation
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_loads = orjson.loads if orjson else json.loads
+JSON_DECODE_ERRORS = (json.JSONDecodeError, orjson.JSONDecodeError) if orjson else (json.JSONDecodeError,)
+
+# Credential files that become GitHub Secrets
+SECRETS = [
+    {
+        "name": "PROVEN_SESSION",
+        "file": "state/proven_session.json",
+        "description": "CapCut session cookies (login credentials)"
+    },
+    {
+        "name": "YOUTUBE_CREDENTIALS",
+        "file": "youtube_credentials.json",
+        "description": "YouTube OAuth 2.0 credentials from Google Cloud Console"
+    },
+    {
+        "name": "YOUTUBE_TOKEN",
+        "file": "youtube_token.json",
+        "description": "YouTube access token (generated after first upload)"
+    },
+    {
+        "name": "GOOGLE_CREDENTIALS",
+        "file": "google_credentials.json",
+        "description": "Google Sheets API credentials"
+    }
+]
+
 def print_separator():
     print("=" * 70)
 
@@ -26,12 +61,13 @@ def print_secret(name, file_path, description):
         return False
     
     try:
-        with open(file, 'r', encoding='utf-8') as f:
-            content = f.read()
+        with open(file, 'rb', buffering=65536) as f:
+            raw = f.read()
+        content = raw.decode('utf-8')
         
-        # Validate JSON
+        # Validate JSON straight from the bytes
         if file.suffix == '.json':
-            json.loads(content)  # Will raise error if invalid
+            _loads(raw)  # Raises if invalid
         
         print("✅ File found and valid")
         print()
@@ -49,7 +85,7 @@ def print_secret(name, file_path, description):
         print()
         return True
         
-    except json.JSONDecodeError:
+    except JSON_DECODE_ERRORS:
         print(f"❌ Invalid JSON in {file_path}")
         print("⚠️  Please fix the JSON format first")
         print()
@@ -59,7 +95,45 @@ def print_secret(name, file_path, description):
         print()
         return False
 
-def main():
+def print_raw_secret(name, secrets):
+    """Print just the secret's value, for piping into `gh secret set NAME`"""
+    if name == "OPENROUTER_API_KEY":
+        try:
+            with open("manifest.json", 'rb') as f:
+                manifest = _loads(f.read())
+            api_key = manifest.get('openrouter_api_key', '')
+        except (OSError, ValueError):
+            api_key = ''
+        if not api_key:
+            print("❌ openrouter_api_key not found in manifest.json", file=sys.stderr)
+            return False
+        sys.stdout.write(api_key)
+        return True
+    
+    for secret in secrets:
+        if secret["name"] == name:
+            try:
+                with open(secret["file"], 'rb') as f:
+                    sys.stdout.write(f.read().decode('utf-8'))
+                return True
+            except OSError as e:
+                print(f"❌ Error reading {secret['file']}: {e}", file=sys.stderr)
+                return False
+    
+    print(f"❌ Unknown secret: {name}", file=sys.stderr)
+    return False
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Extract credential files for GitHub Secrets")
+    parser.add_argument('--batch', action='store_true',
+                        help='Print every secret without pausing between them')
+    parser.add_argument('--secret', metavar='NAME',
+                        help='Print only the raw value of one secret (e.g. for `gh secret set NAME`)')
+    args = parser.parse_args(argv)
+    
+    if args.secret:
+        return 0 if print_raw_secret(args.secret, SECRETS) else 1
+    
     print()
     print("🔐 GitHub Actions Secrets Extractor")
     print("=" * 70)
@@ -71,28 +145,6 @@ def main():
     print("   They should only be stored as GitHub Secrets.")
     print()
     
-    secrets = [
-        {
-            "name": "PROVEN_SESSION",
-            "file": "state/proven_session.json",
-            "description": "CapCut session cookies (login credentials)"
-        },
-        {
-            "name": "YOUTUBE_CREDENTIALS",
-            "file": "youtube_credentials.json",
-            "description": "YouTube OAuth 2.0 credentials from Google Cloud Console"
-        },
-        {
-            "name": "YOUTUBE_TOKEN",
-            "file": "youtube_token.json",
-            "description": "YouTube access token (generated after first upload)"
-        },
-        {
-            "name": "GOOGLE_CREDENTIALS",
-            "file": "google_credentials.json",
-            "description": "Google Sheets API credentials"
-        }
-    ]
     
     # Check OpenRouter API key from manifest
     manifest_file = Path("manifest.json")
@@ -125,10 +177,11 @@ def main():
             pass
     
     # Process each secret
-    for secret in secrets:
+    for secret in SECRETS:
         print_secret(secret["name"], secret["file"], secret["description"])
-        input("Press Enter to continue to next secret...")
-        print()
+        if not args.batch:
+            input("Press Enter to continue to next secret...")
+            print()
     
     print_separator()
     print("✅ All secrets extracted!")
@@ -142,6 +195,7 @@ def main():
     print("📚 For detailed setup instructions, see:")
     print("   GITHUB_ACTIONS_SETUP.md")
     print()
+    return 0
 
 if __name__ == '__main__':
-    main()
+    sys.exit(main())
@@ -15,11 +15,21 @@ Usage:
 
 import sys
 import os
+import json
 import subprocess
+import compileall
+import importlib.util
 import logging
 from pathlib import Path
 import argparse
 import time
+from concurrent.futures import ThreadPoolExecutor
+
+# Optional: faster manifest (de)serialization
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Configure logging
 logging.basicConfig(
@@ -49,59 +59,99 @@ class PipelineOrchestrator:
         
     def print_banner(self, title):
         """Print a formatted banner"""
-        logger.info("=" * 70)
-        logger.info(f"  {title}")
-        logger.info("=" * 70)
+        logger.info("%s\n  %s\n%s", "=" * 70, title, "=" * 70)
     
-    def run_command(self, cmd, step_name):
-        """Run a command and handle errors"""
+    def load_entry_point(self, script):
+        """Import a pipeline script and return its main(), or None if it can't be imported
+        
+        Calling main() in this interpreter skips a fresh Python startup and
+        re-importing heavy dependencies for every step. Only for scripts that
+        keep process-wide setup (logging, stdio) under __main__ and return
+        an exit code instead of exiting the process.
+        """
+        try:
+            # Scripts import their sibling modules (e.g. src/main.py -> sheets_reader)
+            if str(script.parent) not in sys.path:
+                sys.path.insert(0, str(script.parent))
+            module_name = f"pipeline_{script.parent.name}_{script.stem}"
+            spec = importlib.util.spec_from_file_location(module_name, script)
+            module = importlib.util.module_from_spec(spec)
+            sys.modules[module_name] = module
+            spec.loader.exec_module(module)
+            return module.main
+        except Exception as e:
+            logger.warning(f"Could not import {script.name} ({e}), running it as a subprocess")
+            return None
+    
+    def call_entry_point(self, entry_point, cmd):
+        """Call a script's main() as if it had been run as cmd; returns the exit code"""
+        saved_argv, saved_cwd = sys.argv, os.getcwd()
+        sys.argv = cmd[1:]
+        os.chdir(self.project_root)
+        try:
+            returncode = entry_point(cmd[2:])
+        except SystemExit as e:
+            # argparse errors and explicit sys.exit() calls
+            returncode = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+        finally:
+            sys.argv = saved_argv
+            os.chdir(saved_cwd)
+        return returncode or 0
+    
+    def run_command(self, cmd, step_name, entry_point=None):
+        """Run a command and handle errors
+        
+        With entry_point (the script's main()), cmd is run in-process instead.
+        """
         self.print_banner(f"STEP: {step_name}")
-        logger.info(f"Command: {' '.join(cmd)}")
-        logger.info("")
+        logger.info(f"Command: {' '.join(cmd)}\n")
         
         start_time = time.time()
         
         try:
-            # Run the command (don't use check=True to continue on error)
-            result = subprocess.run(
-                cmd,
-                cwd=str(self.project_root),
-                capture_output=False,  # Show output in real-time
-                text=True
-            )
+            if entry_point is not None:
+                returncode = self.call_entry_point(entry_point, cmd)
+            else:
+                # Relay the child's output line by line (stderr merged in order)
+                with subprocess.Popen(
+                    cmd,
+                    cwd=str(self.project_root),
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT,
+                    bufsize=1,
+                    text=True,
+                    errors='replace'
+                ) as proc:
+                    for line in proc.stdout:
+                        sys.stdout.write(line)
+                        sys.stdout.flush()
+                    returncode = proc.wait()
             
             elapsed = time.time() - start_time
-            logger.info("")
             
             # Check exit code
-            if result.returncode == 0:
-                logger.info(f"✅ {step_name} completed successfully in {elapsed:.1f} seconds")
-                logger.info("")
+            if returncode == 0:
+                logger.info(f"✅ {step_name} completed successfully in {elapsed:.1f} seconds\n")
                 return True
             else:
-                logger.error(f"❌ {step_name} failed with exit code {result.returncode} after {elapsed:.1f} seconds")
-                logger.error("")
+                logger.error(f"❌ {step_name} failed with exit code {returncode} after {elapsed:.1f} seconds\n")
                 
                 if self.continue_on_error:
-                    logger.warning("⚠️  Continuing to next step despite error...")
-                    logger.info("")
+                    logger.warning("⚠️  Continuing to next step despite error...\n")
                     return True  # Continue anyway
                 else:
                     return False
             
         except FileNotFoundError:
-            logger.error(f"❌ Script not found: {cmd[0]}")
-            logger.error("")
+            logger.error(f"❌ Script not found: {cmd[0]}\n")
             return False
         except Exception as e:
             elapsed = time.time() - start_time
             logger.error(f"❌ {step_name} failed after {elapsed:.1f} seconds")
-            logger.error(f"Error: {e}")
-            logger.error("")
+            logger.error(f"Error: {e}\n")
             
             if self.continue_on_error:
-                logger.warning("⚠️  Continuing to next step despite error...")
-                logger.info("")
+                logger.warning("⚠️  Continuing to next step despite error...\n")
                 return True  # Continue anyway
             else:
                 return False
@@ -109,8 +159,7 @@ class PipelineOrchestrator:
     def step1_video_generation(self):
         """Step 1: Generate video using CapCut AI (main.py)"""
         if self.skip_generation:
-            logger.info("⏭️  Skipping video generation (--skip-generation flag)")
-            logger.info("")
+            logger.info("⏭️  Skipping video generation (--skip-generation flag)\n")
             return True
         
         if not self.main_script.exists():
@@ -126,6 +175,8 @@ class PipelineOrchestrator:
             cmd.append("--headless")
             logger.info("🤖 GitHub Actions detected - running in headless mode")
         
+        # Always a subprocess: browser automation can hang, crash or leave threads
+        # behind, and that must not take the rest of the pipeline down with it
         return self.run_command(cmd, "Video Generation & Download (main.py)")
     
     def step2_video_editing(self):
@@ -152,13 +203,13 @@ class PipelineOrchestrator:
             "--manifest", str(self.manifest),
             "--work-dir", "work"
         ]
-        return self.run_command(cmd, "Video Editing with AI (auto_edit.py)")
+        return self.run_command(cmd, "Video Editing with AI (auto_edit.py)",
+                                entry_point=self.load_entry_point(self.editor_script))
     
     def step3_youtube_upload(self):
         """Step 3: Upload to YouTube (youtube_uploader.py)"""
         if self.skip_upload:
-            logger.info("⏭️  Skipping YouTube upload (--skip-upload flag)")
-            logger.info("")
+            logger.info("⏭️  Skipping YouTube upload (--skip-upload flag)\n")
             return True
         
         if not self.uploader_script.exists():
@@ -172,7 +223,26 @@ class PipelineOrchestrator:
             "--video", "AUTO",
             "--privacy", self.privacy
         ]
-        return self.run_command(cmd, f"YouTube Upload ({self.privacy}) (youtube_uploader.py)")
+        return self.run_command(cmd, f"YouTube Upload ({self.privacy}) (youtube_uploader.py)",
+                                entry_point=self.load_entry_point(self.uploader_script))
+    
+    def precompile_scripts(self):
+        """Byte-compile the step scripts up front (skips ones already up to date)
+        
+        Warms __pycache__ for the imports each step does, and catches syntax
+        errors before Step 1 spends minutes generating a video.
+        """
+        scripts = [s for s in (self.main_script, self.editor_script, self.uploader_script) if s.exists()]
+        start_time = time.time()
+        with ThreadPoolExecutor(max_workers=len(scripts) or 1) as executor:
+            results = list(executor.map(lambda s: compileall.compile_file(str(s), quiet=1), scripts))
+        
+        failed = [s.name for s, ok in zip(scripts, results) if not ok]
+        if failed:
+            logger.error(f"❌ Syntax errors in: {', '.join(failed)}")
+            return False
+        logger.info(f"Scripts compiled in {time.time() - start_time:.2f} seconds")
+        return True
     
     def reset_manifest_to_auto_detect(self):
         """Reset manifest.json to AUTO_DETECT before pipeline runs"""
@@ -181,42 +251,57 @@ class PipelineOrchestrator:
                 logger.warning(f"Manifest not found: {self.manifest}")
                 return
             
-            import json
-            with open(self.manifest, 'r') as f:
-                manifest_data = json.load(f)
+            with open(self.manifest, 'rb') as f:
+                raw = f.read()
+            manifest_data = orjson.loads(raw) if orjson else json.loads(raw)
+            
+            # Already in AUTO_DETECT mode: leave the file (and its mtime) alone
+            if (manifest_data.get('input_video') == 'AUTO_DETECT'
+                    and manifest_data.get('output_video') == 'AUTO_DETECT'):
+                logger.info("✅ manifest.json already in AUTO_DETECT mode\n")
+                return
             
             # Reset to AUTO_DETECT
             manifest_data['input_video'] = 'AUTO_DETECT'
             manifest_data['output_video'] = 'AUTO_DETECT'
             
-            with open(self.manifest, 'w') as f:
-                json.dump(manifest_data, f, indent=2)
+            if orjson:
+                payload = orjson.dumps(manifest_data, option=orjson.OPT_INDENT_2)
+            else:
+                payload = json.dumps(manifest_data, indent=2, ensure_ascii=False).encode('utf-8')
+            # Single write to a temp file, then an atomic swap, so a killed run
+            # never leaves a half-written manifest
+            tmp_manifest = self.manifest.with_suffix('.json.tmp')
+            tmp_manifest.write_bytes(payload)
+            os.replace(tmp_manifest, self.manifest)
             
-            logger.info("✅ Reset manifest.json to AUTO_DETECT mode")
-            logger.info("")
+            logger.info("✅ Reset manifest.json to AUTO_DETECT mode\n")
             
         except Exception as e:
-            logger.warning(f"Could not reset manifest: {e}")
-            logger.info("")
+            logger.warning(f"Could not reset manifest: {e}\n")
     
     def run(self):
         """Run the complete pipeline"""
         self.print_banner("🎬 FULL VIDEO PRODUCTION PIPELINE")
-        logger.info("Pipeline Steps:")
-        logger.info("  1. Video Generation (CapCut AI + Download)")
-        logger.info("  2. Video Editing (FFmpeg + Whisper + DeepSeek AI)")
-        logger.info("  3. YouTube Upload (with metadata & subtitles)")
-        logger.info("")
+        logger.info(
+            "Pipeline Steps:\n"
+            "  1. Video Generation (CapCut AI + Download)\n"
+            "  2. Video Editing (FFmpeg + Whisper + DeepSeek AI)\n"
+            "  3. YouTube Upload (with metadata & subtitles)\n"
+        )
         
         if self.skip_generation:
             logger.info("⚠️  Video generation will be SKIPPED")
         if self.skip_upload:
             logger.info("⚠️  YouTube upload will be SKIPPED")
-        logger.info("")
         
         # Reset manifest to AUTO_DETECT before starting
         self.reset_manifest_to_auto_detect()
         
+        if not self.precompile_scripts():
+            logger.error("Pipeline aborted before Step 1: fix the scripts above")
+            return False
+        
         pipeline_start = time.time()
         
         # Step 1: Video Generation
@@ -224,6 +309,14 @@ class PipelineOrchestrator:
             logger.error("Pipeline failed at Step 1: Video Generation")
             return False
         
+        # CapCut sometimes exits 0 without downloading anything; don't edit and
+        # upload an old video in that case
+        if not self.skip_generation:
+            downloads = self.project_root / "downloads"
+            if not any(p.stat().st_mtime >= pipeline_start for p in downloads.glob("*.mp4")):
+                logger.error("Pipeline failed at Step 1: no new video in downloads/")
+                return False
+        
         # Step 2: Video Editing
         if not self.step2_video_editing():
             logger.error("Pipeline failed at Step 2: Video Editing")
@@ -237,20 +330,21 @@ class PipelineOrchestrator:
         # Success!
         total_time = time.time() - pipeline_start
         self.print_banner("🎉 PIPELINE COMPLETED!")
-        logger.info(f"Total time: {total_time:.1f} seconds ({total_time/60:.1f} minutes)")
-        logger.info("")
-        logger.info("Output files:")
-        logger.info("  📁 downloads/     - Raw generated video")
-        logger.info("  📁 edited/        - Edited video + subtitles + metadata")
-        logger.info("  🌐 YouTube        - Published video")
-        logger.info("")
+        logger.info(f"Total time: {total_time:.1f} seconds ({total_time/60:.1f} minutes)\n")
+        logger.info(
+            "Output files:\n"
+            "  📁 downloads/     - Raw generated video\n"
+            "  📁 edited/        - Edited video + subtitles + metadata\n"
+            "  🌐 YouTube        - Published video\n"
+        )
         
-        # Countdown before exit
-        logger.info("Window will close in 30 seconds...")
-        for i in range(30, 0, -1):
-            print(f"\rClosing in {i} seconds... (Press Ctrl+C to keep open)", end='', flush=True)
-            time.sleep(1)
-        print("\r" + " " * 60 + "\r", end='', flush=True)  # Clear countdown line
+        # Nobody is watching the window in CI
+        if os.getenv('CI') or os.getenv('GITHUB_ACTIONS'):
+            return True
+        
+        # Give the user a moment to read the summary before the window closes
+        logger.info("Window will close in 30 seconds... (Press Ctrl+C to keep open)")
+        time.sleep(30)
         
         return True
 
@@ -276,6 +370,9 @@ Examples:
   
   # Edit only (skip generation and upload)
   py run_full_pipeline.py --skip-generation --skip-upload
+  
+  # Stop at the first failing step
+  py run_full_pipeline.py --fail-fast
         """
     )
     
@@ -291,6 +388,12 @@ Examples:
         help='Skip YouTube upload step (stop after editing)'
     )
     
+    parser.add_argument(
+        '--fail-fast',
+        action='store_true',
+        help='Stop at the first failing step (also enabled by PIPELINE_FAIL_FAST=1)'
+    )
+    
     parser.add_argument(
         '--privacy',
         default='public',
@@ -300,12 +403,13 @@ Examples:
     
     args = parser.parse_args()
     
-    # Run pipeline (continue_on_error=True to run all steps even if one fails)
+    # Run all steps even if one fails, unless fail-fast was requested
+    fail_fast = args.fail_fast or os.getenv('PIPELINE_FAIL_FAST', '').lower() in ('1', 'true', 'yes')
     orchestrator = PipelineOrchestrator(
         skip_generation=args.skip_generation,
         skip_upload=args.skip_upload,
         privacy=args.privacy,
-        continue_on_error=True
+        continue_on_error=not fail_fast
     )
     
     success = orchestrator.run()
@@ -10,51 +10,69 @@ Handles: Navigation → Form Fill → Generate → Export → Download → Video
 import os
 import sys
 import json
-
-# Fix Windows console encoding for emoji support and disable buffering for real-time output
-if sys.platform == 'win32':
-    try:
-        import codecs
-        # Use line buffering for immediate output
-        sys.stdout = codecs.getwriter('utf-8')(sys.stdout.buffer, 'strict')
-        sys.stderr = codecs.getwriter('utf-8')(sys.stderr.buffer, 'strict')
-    except Exception:
-        pass
-
-# Disable output buffering for real-time console updates
-os.environ['PYTHONUNBUFFERED'] = '1'
+import re
 import time
+import random
+import logging
 import argparse
 import subprocess
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 from datetime import datetime
-from dotenv import load_dotenv
+from concurrent.futures import ThreadPoolExecutor
 
-# Import only what we actually use
-try:
-    from sheets_reader import SheetsReader
-    from proven_browser import ProvenBrowser
-    from state_store import StateStore, JobStatus
-    from video_downloader import VideoDownloader
-    MODULES_AVAILABLE = True
-except ImportError as e:
-    print(f"ERROR: Failed to import modules: {e}")
-    MODULES_AVAILABLE = False
+# Selector, tab and countdown traces are logged at DEBUG; --verbose or LOG_LEVEL=DEBUG shows them.
+# Messages go to stdout unformatted so they interleave with the step prints.
+logger = logging.getLogger('capcut')
+logger.setLevel(os.getenv('LOG_LEVEL', 'INFO').upper())
+if not logger.handlers:
+    _handler = logging.StreamHandler(sys.stdout)
+    _handler.setFormatter(logging.Formatter('%(message)s'))
+    logger.addHandler(_handler)
+    logger.propagate = False
 
-try:
-    from playwright.sync_api import Page, BrowserContext
-    PLAYWRIGHT_AVAILABLE = True
-except ImportError:
-    PLAYWRIGHT_AVAILABLE = False
+# Project root (state/, downloads/, sheets/ live here), resolved once at import
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+STATE_DIR = PROJECT_ROOT / "state"
 
 
-# Override built-in print to always flush for real-time output
-_original_print = print
-def print(*args, **kwargs):
-    """Custom print function that always flushes output for real-time display."""
-    kwargs.setdefault('flush', True)
-    _original_print(*args, **kwargs)
+# Automation modules and Playwright pull in gspread/google-auth and the driver,
+# so they are imported on first use rather than for --help
+MODULES_AVAILABLE = None
+PLAYWRIGHT_AVAILABLE = None
+
+
+def load_modules() -> bool:
+    """
+    Import the automation modules and Playwright into module globals.
+    
+    Returns:
+        True if everything needed for a run is importable
+    """
+    global MODULES_AVAILABLE, PLAYWRIGHT_AVAILABLE
+    global SheetsReader, ProvenBrowser, StateStore, JobStatus, VideoDownloader
+    global expect, PlaywrightTimeoutError
+    
+    if MODULES_AVAILABLE is None:
+        try:
+            from sheets_reader import SheetsReader
+            from proven_browser import ProvenBrowser
+            from state_store import StateStore, JobStatus
+            from video_downloader import VideoDownloader
+            MODULES_AVAILABLE = True
+        except ImportError as e:
+            print(f"ERROR: Failed to import modules: {e}")
+            MODULES_AVAILABLE = False
+    
+    if PLAYWRIGHT_AVAILABLE is None:
+        try:
+            from playwright.sync_api import expect
+            from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+            PLAYWRIGHT_AVAILABLE = True
+        except ImportError:
+            PLAYWRIGHT_AVAILABLE = False
+    
+    return MODULES_AVAILABLE and PLAYWRIGHT_AVAILABLE
 
 
 class JobState:
@@ -88,25 +106,260 @@ class CapCutOrchestrator:
     CAPCUT_BASE_URL = "https://www.capcut.com"
     CAPCUT_AI_CREATOR_URL = "https://www.capcut.com/ai-homepage?enter_from=page_header&from_page=work_space&start_tab=video"
     
-    def __init__(self, dry_run: bool = False, headless: bool = False):
+    # Progress UI shown while CapCut matches stock media / renders an export
+    MATCHING_BUSY_SELECTOR = "[class*='matching'], [class*='loading-spinner'], [class*='loading'], [role='progressbar']"
+    EXPORT_BUSY_SELECTOR = "[class*='exporting'], [class*='progress'], [role='progressbar']"
+    
+    # Popup container of an open dropdown; option lookups stay inside it
+    DROPDOWN_MENU_SELECTOR = (
+        "[role='listbox'], [role='menu'], .lv-select-popup, .lv-dropdown-menu, "
+        "[class*='dropdown-menu'], [class*='select-popup']"
+    )
+    
+    # In-page click helpers, registered once per context as window.__cc so each
+    # match_stock_media step only sends the call instead of the whole script
+    PAGE_HELPERS_JS = """
+        window.__cc = {
+            isVisible: (el) => el.offsetParent !== null,
+            // First visible match for a CSS selector under root, or null
+            firstVisible: (css, root = document) => {
+                for (const el of root.querySelectorAll(css)) {
+                    if (window.__cc.isVisible(el)) return el;
+                }
+                return null;
+            },
+            anyVisible: (css) => window.__cc.firstVisible(css) !== null,
+            // First visible element for a list of { selector, css, text } specs, in
+            // priority order; index is its position among all of that css's text matches
+            scanSelectors: (specs) => {
+                const norm = (t) => (t || '').replace(/\\s+/g, ' ').trim().toLowerCase();
+                for (const spec of specs) {
+                    let elements;
+                    try {
+                        elements = Array.from(document.querySelectorAll(spec.css));
+                    } catch (e) {
+                        continue;  // Not valid CSS
+                    }
+                    const wanted = norm(spec.text);
+                    if (wanted) elements = elements.filter(el => norm(el.textContent).includes(wanted));
+                    const index = elements.findIndex(window.__cc.isVisible);
+                    if (index >= 0) {
+                        return { selector: spec.selector, index, text: elements[index].textContent || '' };
+                    }
+                }
+                return null;
+            },
+            // XPath string literal for arbitrary text (concat() when it holds both quote kinds)
+            xpathLiteral: (text) => {
+                if (!text.includes("'")) return `'${text}'`;
+                if (!text.includes('"')) return `"${text}"`;
+                return 'concat(' + text.split("'").map(part => `'${part}'`).join(`, "'", `) + ')';
+            },
+            // Visible elements whose whole text is `text`, in document order; the
+            // native XPath walk avoids materialising every node's textContent in JS
+            textXPath: (text, tag) => `//${tag}[normalize-space(.)=${window.__cc.xpathLiteral(text.trim())}]`,
+            findByText: (text, tag = '*') => {
+                const snapshot = document.evaluate(
+                    window.__cc.textXPath(text, tag),
+                    document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+                );
+                const elements = [];
+                for (let i = 0; i < snapshot.snapshotLength; i++) {
+                    const el = snapshot.snapshotItem(i);
+                    if (window.__cc.isVisible(el)) elements.push(el);
+                }
+                return elements;
+            },
+            // Like findByText()[0] (or the last match with `last`), but stops at the
+            // first visible hit instead of checking every match
+            firstByText: (text, tag = '*', last = false) => {
+                const xpath = window.__cc.textXPath(text, tag);
+                if (last) {
+                    const snapshot = document.evaluate(xpath, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+                    for (let i = snapshot.snapshotLength - 1; i >= 0; i--) {
+                        const el = snapshot.snapshotItem(i);
+                        if (window.__cc.isVisible(el)) return el;
+                    }
+                    return null;
+                }
+                const iterator = document.evaluate(xpath, document, null, XPathResult.ORDERED_NODE_ITERATOR_TYPE, null);
+                for (let el = iterator.iterateNext(); el; el = iterator.iterateNext()) {
+                    if (window.__cc.isVisible(el)) return el;
+                }
+                return null;
+            },
+            // Most recently rendered visible dropdown popup, or null
+            openMenu: (css) => {
+                const menus = Array.from(document.querySelectorAll(css)).filter(window.__cc.isVisible);
+                return menus.length ? menus[menus.length - 1] : null;
+            },
+            // Click the option whose whole text is `text` inside the open menu;
+            // lists the first visible option texts when it isn't there
+            clickMenuOption: (menuCss, text) => {
+                const menu = window.__cc.openMenu(menuCss);
+                if (!menu) return { menu: false };
+                const iterator = document.evaluate(
+                    '.' + window.__cc.textXPath(text, '*'), menu, null, XPathResult.ORDERED_NODE_ITERATOR_TYPE, null
+                );
+                for (let el = iterator.iterateNext(); el; el = iterator.iterateNext()) {
+                    if (window.__cc.isVisible(el)) {
+                        el.click();
+                        return { menu: true, text: el.textContent.trim() };
+                    }
+                }
+                const options = Array.from(menu.querySelectorAll("[role='option'], li, button, option"))
+                    .filter(window.__cc.isVisible)
+                    .slice(0, 10)
+                    .map(o => (o.textContent || '').trim());
+                return { menu: true, text: null, options };
+            },
+            clickByText: (text) => {
+                const element = window.__cc.firstByText(text);
+                if (element) {
+                    element.click();
+                    return { success: true };
+                }
+                return { success: false };
+            },
+            // Resolve with find()'s result as soon as it is truthy, re-checking on
+            // DOM mutations instead of polling; null on timeout
+            waitFor: (find, timeout) => new Promise(resolve => {
+                const found = find();
+                if (found) return resolve(found);
+                const observer = new MutationObserver(() => {
+                    const el = find();
+                    if (el) {
+                        observer.disconnect();
+                        clearTimeout(timer);
+                        resolve(el);
+                    }
+                });
+                const timer = setTimeout(() => { observer.disconnect(); resolve(null); }, timeout);
+                observer.observe(document.body, { childList: true, subtree: true, attributes: true });
+            }),
+            // Last visible element whose text is `text` (dropdown popups render after
+            // the form), ignoring `exclude` and its ancestors or descendants
+            waitForText: (text, exclude, timeout) => window.__cc.waitFor(() => {
+                const matches = window.__cc.findByText(text).filter(el =>
+                    !exclude || !(exclude.contains(el) || el.contains(exclude))
+                );
+                return matches.length ? matches[matches.length - 1] : null;
+            }, timeout),
+            // Open each dropdown and pick its value in turn; returns { field: applied }
+            applyForm: async (fields) => {
+                const results = {};
+                for (const field of fields) {
+                    let opener = null;
+                    for (const o of field.openers) {
+                        opener = o.text
+                            ? window.__cc.firstByText(o.text)
+                            : window.__cc.firstVisible(o.css);
+                        if (opener) break;
+                    }
+                    if (!opener) {
+                        results[field.name] = false;
+                        continue;
+                    }
+                    opener.click();
+                    const option = await window.__cc.waitForText(field.value, opener, 3000);
+                    if (option) option.click();
+                    results[field.name] = !!option;
+                    await new Promise(r => setTimeout(r, 300));  // Let the dropdown close
+                }
+                return results;
+            },
+            findMatchButton: () => {
+                // Method 1: Try class-based selector first
+                const matchBtn = document.querySelector("div[class*='match-media-btn']");
+                if (matchBtn && window.__cc.isVisible(matchBtn)) {
+                    return { el: matchBtn, method: 'class-selector' };
+                }
+                
+                // Method 2: Last visible div with exact "Match" text
+                const matchDiv = window.__cc.firstByText('Match', 'div', true);
+                if (matchDiv) {
+                    return { el: matchDiv, method: 'text-match' };
+                }
+                return null;
+            },
+            findContinueButton: () => Array.from(document.querySelectorAll('button, div[role="button"]')).find(btn =>
+                window.__cc.isVisible(btn) && btn.textContent.toLowerCase().includes('continue')
+            ),
+            // Media tab -> Match -> Continue in one call, each step waiting for its
+            // target to render; stops at the first missing target
+            matchStockMedia: async (timeout) => {
+                // Human-like 200-600ms delay before each click, once its target is up
+                const pause = () => new Promise(r => setTimeout(r, 200 + Math.random() * 400));
+                const result = { media: false, matchMethod: null, continueText: null };
+                
+                const media = await window.__cc.waitFor(() => window.__cc.firstByText('Media'), timeout);
+                if (!media) return result;
+                await pause();
+                (window.__cc.firstByText('Media') || media).click();
+                result.media = true;
+                
+                const match = await window.__cc.waitFor(window.__cc.findMatchButton, timeout);
+                if (!match) return result;
+                await pause();
+                (window.__cc.findMatchButton() || match).el.click();
+                result.matchMethod = match.method;
+                
+                const continueBtn = await window.__cc.waitFor(window.__cc.findContinueButton, timeout);
+                if (!continueBtn) return result;
+                await pause();
+                continueBtn.click();
+                result.continueText = continueBtn.textContent.trim();
+                return result;
+            }
+        };
+    """
+    
+    # How to open each form dropdown (current default text or CSS), tried in order
+    FORM_DROPDOWN_OPENERS = {
+        'visual_style': [{'text': 'Realistic Film'}],
+        'voice': [
+            {'text': 'Ms. Labebe'},
+            {'text': 'Lady Holiday'},
+            {'css': '.dropdownButton-peTABv'},
+            {'css': "[class*='voice'] button"}
+        ],
+        'duration': [{'css': '.lv-select-suffix-icon'}, {'text': '1 min'}, {'text': '30s'}],
+        'aspect_ratio': [{'text': '16:9'}, {'css': '.lv-select-view-value'}]
+    }
+    
+    # Any of these appearing means generation has finished (Export button is the main one)
+    GENERATION_COMPLETE_SELECTOR = (
+        "button:has-text('Export'), button:has-text('Download'), button:has-text('Save'), "
+        "[data-testid*='export'], .export-btn"
+    )
+    
+    def __init__(self, dry_run: bool = False, headless: bool = False, use_sheets_cache: bool = True):
         """
         Initialize the orchestrator.
         
         Args:
             dry_run: If True, simulate actions without performing them
             headless: Whether to run browser in headless mode
+            use_sheets_cache: Reuse a recent Google Sheets read instead of refetching
         """
-        if not MODULES_AVAILABLE:
+        if not load_modules():
             raise ImportError("Required automation modules not available")
         
         self.dry_run = dry_run
         self.headless = headless
         
         # Load environment variables
+        from dotenv import load_dotenv
         load_dotenv()
         
+        # Sheets work that can overlap with other setup or with the browser waiting on CapCut
+        self.background = ThreadPoolExecutor(max_workers=1)
+        self.status_worksheet_future = None
+        
         # Initialize only what we use
-        self.sheets_reader = SheetsReader()
+        self.sheets_reader = SheetsReader(use_cache=use_sheets_cache)
+        # Token fetch runs while the remaining managers initialise
+        self.auth_future = self.background.submit(self.sheets_reader.ensure_authenticated)
         self.browser_manager = ProvenBrowser()
         self.state_store = StateStore()
         self.video_downloader = VideoDownloader()
@@ -114,6 +367,9 @@ class CapCutOrchestrator:
         # Session state
         self.browser_context = None
         self.current_page = None
+        self.opened_pages = []  # Tabs opened since the last Generate click
+        self.locator_cache = {}  # (page, url, selector) -> Locator, see _loc()
+        self.selector_specs = {}  # tuple(selectors) -> (page specs, Playwright-only), see _first_visible()
         
         # Job management
         self.jobs = []
@@ -128,8 +384,8 @@ class CapCutOrchestrator:
         }
         
         # Simple state management
-        self.project_root = Path(__file__).parent.parent
-        self.state_dir = self.project_root / "state"
+        self.project_root = PROJECT_ROOT
+        self.state_dir = STATE_DIR
     
     def load_jobs(self, source: Optional[str] = None, limit: Optional[int] = None) -> bool:
         """
@@ -149,6 +405,7 @@ class CapCutOrchestrator:
             print("=" * 60)
             
             # Force Google Sheets source
+            self.auth_future.result()
             result = self.sheets_reader.get_video_jobs(force_source="sheets")
             
             if not result["success"]:
@@ -228,8 +485,12 @@ class CapCutOrchestrator:
                 print("❌ Failed to create browser context")
                 return False
             
-            # Create page
-            self.current_page = self.browser_context.new_page()
+            self.browser_context.add_init_script(self.PAGE_HELPERS_JS)
+            self.browser_context.on("page", self.opened_pages.append)
+            
+            # Create page (a persistent browser may already have one open)
+            pages = self.browser_context.pages
+            self.current_page = pages[0] if pages else self.browser_context.new_page()
             
             print("✅ SUCCESS: Browser session ready!")
             print("🎉 Using existing proven session - no login needed!")
@@ -258,9 +519,13 @@ class CapCutOrchestrator:
             print("⏳ Loading page...")
             self.current_page.goto(self.CAPCUT_AI_CREATOR_URL, timeout=60000)
             
-            # Wait for page to load
+            # Wait for the DOM and the prompt box rather than a fixed delay
             print("⏳ Waiting for page to load...")
-            time.sleep(5)
+            self.current_page.wait_for_load_state("domcontentloaded")
+            try:
+                self.current_page.wait_for_selector("textarea", state="visible", timeout=15000)
+            except PlaywrightTimeoutError:
+                print("   ⚠️  Prompt textarea not visible yet - continuing")
             
             # Check current URL
             current_url = self.current_page.url
@@ -306,59 +571,89 @@ class CapCutOrchestrator:
                 "textarea"
             ]
             
-            textarea_found = False
-            for selector in textarea_selectors:
-                try:
-                    print(f"   Trying: {selector}")
-                    textarea = self.current_page.locator(selector).first
-                    if textarea.is_visible():
-                        print(f"   ✅ Found textarea with: {selector}")
+            # Find, clear and fill in one round-trip. React only picks up the value
+            # through the native setter followed by an input event.
+            matched = self.current_page.evaluate("""
+                ([selectors, text]) => {
+                    for (const selector of selectors) {
+                        let el = Array.from(document.querySelectorAll(selector))
+                            .find(e => e.offsetParent !== null);
+                        if (el && el.tagName !== 'TEXTAREA') el = el.querySelector('textarea');
+                        if (!el) continue;
+                        const setter = Object.getOwnPropertyDescriptor(
+                            HTMLTextAreaElement.prototype, 'value').set;
+                        el.focus();
+                        setter.call(el, text);
+                        el.dispatchEvent(new Event('input', { bubbles: true }));
+                        el.dispatchEvent(new Event('change', { bubbles: true }));
+                        return el.value === text ? selector : null;
+                    }
+                    return null;
+                }
+            """, [textarea_selectors, job['title']])
+            
+            textarea_found = bool(matched)
+            if textarea_found:
+                print(f"   ✅ Found textarea with: {matched}")
+                print(f"   ✅ Filled with: {job['title']}")
+            
+            # Fall back to Playwright locators if the in-page fill didn't stick
+            if not textarea_found:
+                for selector in textarea_selectors:
+                    try:
+                        logger.debug(f"   Trying: {selector}")
+                        textarea = self.current_page.locator(selector).first
+                        if textarea.is_visible():
+                            print(f"   ✅ Found textarea with: {selector}")
                         
-                        # Clear and fill with job title/description
-                        textarea.click()
-                        textarea.fill("")  # Clear first
-                        textarea.fill(job['title'])
+                            # Replace any existing text with the job title/description
+                            textarea.fill(job['title'])
                         
-                        print(f"   ✅ Filled with: {job['title']}")
-                        textarea_found = True
-                        break
-                except Exception as e:
-                    print(f"   ❌ Failed: {e}")
-                    continue
+                            print(f"   ✅ Filled with: {job['title']}")
+                            textarea_found = True
+                            break
+                    except Exception as e:
+                        logger.debug(f"   ❌ Failed: {e}")
+                        continue
             
             if not textarea_found:
                 print("❌ Could not find description textarea")
                 return False
             
-            # Wait a bit for the form to process
-            time.sleep(2)
-            
-            # Step 2: Set Visual Style
-            print("2️⃣ Setting visual style...")
-            if not self._set_visual_style(job['visual_style']):
-                print("❌ Failed to set visual style")
-                return False
-            
-            # Step 3: Set Voice
-            print("3️⃣ Setting voice...")
-            if not self._set_voice(job['voice']):
-                print("❌ Failed to set voice")
-                return False
-            
-            # Step 4: Set Duration
-            print("4️⃣ Setting duration...")
-            if not self._set_duration(job['duration']):
-                print("❌ Failed to set duration")
-                return False
-            
-            # Step 5: Set Aspect Ratio
-            print("5️⃣ Setting aspect ratio...")
-            if not self._set_aspect_ratio(job['aspect_ratio']):
-                print("❌ Failed to set aspect ratio")
-                return False
+            # Wait until the textarea actually holds the text
+            try:
+                self.current_page.wait_for_function(
+                    "(text) => Array.from(document.querySelectorAll('textarea')).some(t => t.value === text)",
+                    arg=job['title'], timeout=5000
+                )
+            except PlaywrightTimeoutError:
+                logger.debug("   ⚠️  Textarea value not confirmed")
+            
+            # Steps 2-5: Set all dropdowns in one in-page batch, then fall back to
+            # the per-field helpers (virtual-list scrolling etc.) for any it missed
+            print("2️⃣ Setting visual style, voice, duration and aspect ratio...")
+            applied = self._apply_form_batch(job)
+            
+            field_setters = [
+                ('visual_style', 'visual style', self._set_visual_style),
+                ('voice', 'voice', self._set_voice),
+                ('duration', 'duration', self._set_duration),
+                ('aspect_ratio', 'aspect ratio', self._set_aspect_ratio)
+            ]
+            for field, label, setter in field_setters:
+                if applied.get(field):
+                    print(f"   ✅ Set {label}: {job[field]}")
+                    continue
+                print(f"   🔄 Setting {label} individually...")
+                if not setter(job[field]):
+                    print(f"❌ Failed to set {label}")
+                    return False
             
-            # Wait a bit for all settings to process
-            time.sleep(3)
+            # Let the selections settle (CapCut keeps polling, so cap the idle wait)
+            try:
+                self.current_page.wait_for_load_state("networkidle", timeout=3000)
+            except PlaywrightTimeoutError:
+                pass
             
             print("✅ Form filling completed!")
             return True
@@ -390,7 +685,7 @@ class CapCutOrchestrator:
             button_found = False
             for selector in generate_selectors:
                 try:
-                    print(f"   Trying: {selector}")
+                    logger.debug(f"   Trying: {selector}")
                     buttons = self.current_page.locator(selector)
                     count = buttons.count()
                     
@@ -412,7 +707,7 @@ class CapCutOrchestrator:
                         break
                         
                 except Exception as e:
-                    print(f"   ❌ Failed: {e}")
+                    logger.debug(f"   ❌ Failed: {e}")
                     continue
             
             if not button_found:
@@ -437,9 +732,7 @@ class CapCutOrchestrator:
                 print("❌ Could not find Generate button")
                 return False
             
-            # Wait a bit for the click to process
-            time.sleep(2)
-            
+            # handle_generation_page_navigation waits for the resulting tab
             print("✅ Generate button clicked!")
             return True
             
@@ -457,49 +750,45 @@ class CapCutOrchestrator:
         try:
             print("🔍 Looking for popups to close...")
             
-            # Common popup close selectors
+            # Common popup close selectors; Playwright's :has-text() isn't
+            # valid CSS, so button labels are matched separately in the page
             close_selectors = [
-                "button:has-text('×')",  # X button
-                "button:has-text('Close')",
-                "button:has-text('OK')",
-                "button:has-text('Accept')",
-                "button:has-text('Agree')",
-                "button:has-text('Continue')",
                 "[aria-label*='close' i]",
                 "[data-testid*='close']",
                 ".close-btn",
                 ".modal-close",
                 "button[class*='close']"
             ]
+            close_texts = ['×', 'Close', 'OK', 'Accept', 'Agree', 'Continue']
+            
+            # Scan and click in a single round-trip
+            clicked = self.current_page.evaluate("""
+                ([selector, texts]) => {
+                    const wanted = texts.map(t => t.toLowerCase());
+                    const targets = new Set(document.querySelectorAll(selector));
+                    document.querySelectorAll('button').forEach(btn => {
+                        const text = (btn.textContent || '').trim().toLowerCase();
+                        if (text && wanted.some(t => text.includes(t))) targets.add(btn);
+                    });
+                    const clicked = [];
+                    targets.forEach(el => {
+                        if (el.offsetParent !== null) {
+                            clicked.push((el.textContent || '').trim());
+                            el.click();
+                        }
+                    });
+                    return clicked;
+                }
+            """, [", ".join(close_selectors), close_texts])
             
-            popups_closed = 0
-            
-            for selector in close_selectors:
-                try:
-                    buttons = self.current_page.locator(selector)
-                    count = buttons.count()
-                    
-                    for i in range(count):
-                        button = buttons.nth(i)
-                        if button.is_visible():
-                            button_text = button.text_content() or ""
-                            print(f"   Found close button: '{button_text}' with selector: {selector}")
-                            
-                            # Click the close button
-                            button.click()
-                            popups_closed += 1
-                            print(f"   ✅ Closed popup #{popups_closed}")
-                            
-                            # Wait a bit for popup to close
-                            time.sleep(1)
-                            
-                except Exception as e:
-                    continue
+            for button_text in clicked:
+                print(f"   Found close button: '{button_text}'")
+            popups_closed = len(clicked)
             
             # Also try pressing Escape key to close popups
             try:
                 self.current_page.keyboard.press("Escape")
-                print("   📋 Pressed Escape key")
+                logger.debug("   📋 Pressed Escape key")
                 time.sleep(1)
             except Exception:
                 pass
@@ -523,78 +812,49 @@ class CapCutOrchestrator:
         Returns:
             True if navigation handled successfully
         """
+        def is_generation_url(url: str) -> bool:
+            return "ai-creator" in url or "storyboard" in url
+        
+        def switch_to(page) -> bool:
+            print("   🔄 Switching to generation page...")
+            self.current_page = page
+            page.bring_to_front()
+            print("   ✅ Successfully switched to generation page!")
+            print(f"   📍 New active page: {self.current_page.url}")
+            return True
+        
         try:
             print("🔍 Monitoring for new tab/page after Generate click...")
             
-            # Wait for potential new tab/page
             max_wait = 30  # 30 seconds max
-            check_interval = 2
-            elapsed = 0
-            
             original_url = self.current_page.url
             print(f"   Original URL: {original_url}")
             
-            while elapsed < max_wait:
-                # Check all pages/tabs in the browser context
-                all_pages = self.browser_context.pages
-                print(f"   📊 Total pages/tabs: {len(all_pages)}")
-                
-                # Look for the generation page in all tabs
-                for i, page in enumerate(all_pages):
-                    try:
-                        page_url = page.url
-                        print(f"   Tab {i+1}: {page_url}")
-                        
-                        # Check if this is the generation page
-                        if "ai-creator" in page_url or "storyboard" in page_url:
-                            print(f"   🎉 Found generation page in Tab {i+1}!")
-                            print(f"   🔄 Switching to generation page...")
-                            
-                            # Switch to the generation page
-                            self.current_page = page
-                            
-                            # Bring the page to front
-                            page.bring_to_front()
-                            
-                            print(f"   ✅ Successfully switched to generation page!")
-                            print(f"   📍 New active page: {self.current_page.url}")
-                            return True
-                            
-                    except Exception as e:
-                        print(f"   ❌ Error checking tab {i+1}: {e}")
-                        continue
-                
-                # Check if current page URL changed (same tab navigation)
-                current_url = self.current_page.url
-                if current_url != original_url:
-                    print(f"   🎉 Current page navigated to: {current_url}")
-                    
-                    if "ai-creator" in current_url or "storyboard" in current_url:
-                        print("   ✅ Successfully navigated to generation page!")
-                        return True
-                
-                # Check if generation started on current page
+            # Tabs opened by the Generate click were captured by the context's
+            # page listener; only block if none has shown up yet
+            if not self.opened_pages:
                 try:
-                    generation_indicators = [
-                        "[data-testid*='progress']",
-                        ".progress-bar", 
-                        "div:has-text('Generating')",
-                        "div:has-text('Processing')",
-                        "[role='progressbar']"
-                    ]
-                    
-                    for indicator in generation_indicators:
-                        elements = self.current_page.locator(indicator)
-                        if elements.count() > 0 and elements.first.is_visible():
-                            print(f"   ✅ Generation started on current page")
-                            return True
-                            
-                except Exception:
+                    page = self.browser_context.wait_for_event("page", timeout=max_wait * 1000)
+                    if page not in self.opened_pages:
+                        self.opened_pages.append(page)
+                except PlaywrightTimeoutError:
                     pass
-                
-                print(f"   ⏱️ Waiting for new tab/navigation... ({elapsed}s)")
-                time.sleep(check_interval)
-                elapsed += check_interval
+            
+            # A fresh tab starts on about:blank, so wait for it to reach the generation URL
+            for new_page in self.opened_pages:
+                try:
+                    new_page.wait_for_url(is_generation_url, timeout=max_wait * 1000)
+                    print(f"   🎉 New tab opened: {new_page.url}")
+                    return switch_to(new_page)
+                except PlaywrightTimeoutError:
+                    continue
+            
+            # Same-tab navigation
+            current_url = self.current_page.url
+            if current_url != original_url and is_generation_url(current_url):
+                print(f"   🎉 Current page navigated to: {current_url}")
+                print("   ✅ Successfully navigated to generation page!")
+                return True
             
             print("   ⚠️ No new tab detected - continuing with current page")
             return True
@@ -612,81 +872,37 @@ class CapCutOrchestrator:
         """
         try:
             print("⏳ Monitoring video generation progress...")
-            print(f"   📍 Current page: {self.current_page.url}")
+            logger.debug(f"   📍 Current page: {self.current_page.url}")
             
             max_wait_time = 300  # 5 minutes max
-            check_interval = 5   # Check every 5 seconds
-            elapsed_time = 0
             
-            while elapsed_time < max_wait_time:
-                print(f"   ⏱️  Waiting... ({elapsed_time}s / {max_wait_time}s)")
-                print(f"   📍 Checking on: {self.current_page.url}")
-                
-                # Check for generation completion indicators (Export button appears)
-                completion_indicators = [
-                    "button:has-text('Export')",  # Main indicator - Export button appears
-                    "button:has-text('Download')",
-                    "button:has-text('Save')",
-                    "[data-testid*='export']",
-                    ".export-btn",
-                    "div:has-text('Generation complete')",
-                    "div:has-text('Video ready')",
-                    "div:has-text('Complete')"
-                ]
-                
-                # Debug: Show all buttons on page
-                try:
-                    all_buttons = self.current_page.locator("button").all()
-                    button_texts = []
-                    for button in all_buttons[:5]:  # Show first 5 buttons
-                        try:
-                            if button.is_visible():
-                                text = button.text_content() or ""
-                                if text.strip():
-                                    button_texts.append(text.strip())
-                        except Exception:
-                            continue
-                    if button_texts:
-                        print(f"   🔍 Visible buttons: {', '.join(button_texts)}")
-                except Exception:
-                    pass
-                
-                generation_complete = False
-                for indicator in completion_indicators:
-                    try:
-                        elements = self.current_page.locator(indicator)
-                        count = elements.count()
-                        print(f"   🔍 Checking '{indicator}': found {count} elements")
-                        
-                        if count > 0 and elements.first.is_visible():
-                            element_text = elements.first.text_content() or ""
-                            print(f"   🎉 Found completion indicator: '{element_text}' with selector: {indicator}")
-                            print("✅ Video generation completed! Export button is now available.")
-                            generation_complete = True
-                            break
-                    except Exception as e:
-                        print(f"   ❌ Selector '{indicator}' failed: {e}")
-                        continue
-                
-                if generation_complete:
-                    return True  # Exit immediately when Export button is found
-                
-                # Wait before next check
-                time.sleep(check_interval)
-                elapsed_time += check_interval
-                
-                # Also check if we're still on the right page
+            completion_indicator = self.current_page.locator(self.GENERATION_COMPLETE_SELECTOR).first
+            
+            try:
+                expect(completion_indicator).to_be_visible(timeout=max_wait_time * 1000)
+            except AssertionError:
+                print(f"⏰ Timeout: Video generation took longer than {max_wait_time} seconds")
                 try:
-                    current_url = self.current_page.url
-                    if "capcut.com" not in current_url.lower():
-                        print(f"❌ Page changed unexpectedly: {current_url}")
-                        return False
+                    visible = self.current_page.evaluate(
+                        "() => Array.from(document.querySelectorAll('button')).filter(b => b.offsetParent)"
+                        ".map(b => (b.textContent || '').trim()).filter(Boolean).slice(0, 5)"
+                    )
+                    if visible:
+                        logger.debug(f"   🔍 Visible buttons: {', '.join(visible)}")
                 except Exception:
                     pass
+                print("   This might be normal for longer videos. Check manually.")
+                return True  # Return True anyway, might just be a long generation
             
-            print(f"⏰ Timeout: Video generation took longer than {max_wait_time} seconds")
-            print("   This might be normal for longer videos. Check manually.")
-            return True  # Return True anyway, might just be a long generation
+            current_url = self.current_page.url
+            if "capcut.com" not in current_url.lower():
+                print(f"❌ Page changed unexpectedly: {current_url}")
+                return False
+            
+            element_text = completion_indicator.text_content() or ""
+            print(f"   🎉 Found completion indicator: '{element_text.strip()}'")
+            print("✅ Video generation completed! Export button is now available.")
+            return True
             
         except Exception as e:
             print(f"❌ Generation monitoring failed: {e}")
@@ -700,7 +916,7 @@ class CapCutOrchestrator:
         2. Click on "Media" tab
         3. Click on "Match stock media" button
         4. Click "Continue" on the confirmation popup
-        5. Wait 90 seconds for matching to complete
+        5. Wait (up to 90 seconds) for matching to complete
         
         Returns:
             True if stock media matching completed successfully
@@ -711,177 +927,223 @@ class CapCutOrchestrator:
             print("=" * 60)
             
             # Debug: Check current page and frames
-            print(f"📍 Current URL: {self.current_page.url}")
-            print(f"📊 Number of frames: {len(self.current_page.frames)}")
+            logger.debug(f"📍 Current URL: {self.current_page.url}")
+            logger.debug(f"📊 Number of frames: {len(self.current_page.frames)}")
             
             # CRITICAL: Use page.evaluate to run the EXACT console script that works
             print("\n🔧 Using direct JavaScript execution (like console script)...")
             
-            try:
-                # Step 1: Click Scenes using JavaScript (exactly like console)
-                print("1️⃣ Clicking 'Scenes' button with JavaScript...")
-                result = self.current_page.evaluate("""
-                    () => {
-                        const scenesElements = Array.from(document.querySelectorAll('*')).filter(el => 
-                            el.textContent.trim() === 'Scenes' && el.offsetParent !== null
-                        );
-                        if (scenesElements.length > 0) {
-                            scenesElements[0].click();
-                            return { success: true, found: scenesElements.length };
-                        }
-                        return { success: false, found: 0 };
-                    }
-                """)
-                
-                if result['success']:
-                    print(f"   ✅ Clicked 'Scenes' button (found {result['found']} elements)")
-                    scenes_clicked = True
-                else:
-                    print(f"   ❌ Could not find 'Scenes' button")
-                    scenes_clicked = False
-                    
-            except Exception as e:
-                print(f"   ❌ JavaScript execution failed: {e}")
-                scenes_clicked = False
-            
-            if not scenes_clicked:
+            # Step 1: Click Scenes using JavaScript (exactly like console)
+            print("1️⃣ Clicking 'Scenes' button with JavaScript...")
+            result = self._safe_page_helper("Clicking 'Scenes'", 'clickByText', 'Scenes')
+            if not (result and result['success']):
                 print("❌ Could not find 'Scenes' button")
                 return False
+            print(f"   ✅ Clicked 'Scenes' button")
             
-            # Wait for the Scenes panel to open (human-like delay)
-            print("   ⏳ Waiting for Scenes panel to open...")
-            time.sleep(3)
-            
-            # Step 2: Click on "Media" tab using JavaScript
-            print("2️⃣ Clicking 'Media' tab with JavaScript...")
-            time.sleep(0.8)  # Human-like delay before clicking
-            
-            try:
-                result = self.current_page.evaluate("""
-                    () => {
-                        const mediaElements = Array.from(document.querySelectorAll('*')).filter(el => 
-                            el.textContent.trim() === 'Media' && el.offsetParent !== null
-                        );
-                        if (mediaElements.length > 0) {
-                            mediaElements[0].click();
-                            return { success: true, found: mediaElements.length };
-                        }
-                        return { success: false, found: 0 };
-                    }
-                """)
-                
-                if result['success']:
-                    print(f"   ✅ Clicked 'Media' tab (found {result['found']} elements)")
-                    media_clicked = True
-                else:
-                    print(f"   ❌ Could not find 'Media' tab")
-                    return False
-                    
-            except Exception as e:
-                print(f"   ❌ JavaScript execution failed: {e}")
+            # Steps 2-4: Media tab, Match button and Continue popup in one call;
+            # each click waits in the page for its target to render
+            print("2️⃣ Clicking 'Media' tab, 'Match' and 'Continue' with JavaScript...")
+            result = self._safe_page_helper('Stock media matching', 'matchStockMedia', 10000)
+            if result is None:
                 return False
             
-            # Wait for the Media panel to load (human-like delay)
-            print("   ⏳ Waiting for Media panel to load...")
-            time.sleep(2.5)
-            
-            # Step 3: Click on "Match" button using JavaScript
-            print("3️⃣ Clicking 'Match' button with JavaScript...")
-            time.sleep(1.2)  # Human-like delay before clicking
-            
-            try:
-                result = self.current_page.evaluate("""
-                    () => {
-                        // Method 1: Try class-based selector first
-                        const matchBtn = document.querySelector("div[class*='match-media-btn']");
-                        if (matchBtn && matchBtn.offsetParent !== null) {
-                            matchBtn.click();
-                            return { success: true, method: 'class-selector' };
-                        }
-                        
-                        // Method 2: Find all divs with exact "Match" text
-                        const allDivs = Array.from(document.querySelectorAll('div'));
-                        const matchDivs = allDivs.filter(div => {
-                            const text = div.textContent.trim();
-                            return text === 'Match' && div.offsetParent !== null;
-                        });
-                        
-                        if (matchDivs.length > 0) {
-                            matchDivs[matchDivs.length - 1].click(); // Use last one
-                            return { success: true, method: 'text-match', found: matchDivs.length };
-                        }
-                        
-                        return { success: false };
-                    }
-                """)
-                
-                if result['success']:
-                    method = result.get('method', 'unknown')
-                    print(f"   ✅ Clicked 'Match' button (method: {method})")
-                    match_clicked = True
-                else:
-                    print(f"   ❌ Could not find 'Match' button")
-                    return False
-                    
-            except Exception as e:
-                print(f"   ❌ JavaScript execution failed: {e}")
+            if not result['media']:
+                print(f"   ❌ Could not find 'Media' tab")
                 return False
+            print("   ✅ Clicked 'Media' tab")
             
-            # Wait longer for confirmation popup to appear (human-like delay)
-            print("   ⏳ Waiting for confirmation popup...")
-            time.sleep(3.5)
-            
-            # Step 4: Click "Continue" button using JavaScript
-            print("4️⃣ Clicking 'Continue' button with JavaScript...")
-            time.sleep(0.6)  # Human-like delay before clicking
+            if not result['matchMethod']:
+                print(f"   ❌ Could not find 'Match' button")
+                return False
+            print(f"   ✅ Clicked 'Match' button (method: {result['matchMethod']})")
             
-            try:
-                result = self.current_page.evaluate("""
-                    () => {
-                        const allButtons = Array.from(document.querySelectorAll('button, div[role="button"]')).filter(btn => 
-                            btn.offsetParent !== null
-                        );
-                        
-                        const continueBtn = allButtons.find(btn => 
-                            btn.textContent.toLowerCase().includes('continue')
-                        );
-                        
-                        if (continueBtn) {
-                            continueBtn.click();
-                            return { success: true, text: continueBtn.textContent.trim() };
-                        }
-                        
-                        return { success: false };
-                    }
-                """)
-                
-                if result['success']:
-                    print(f"   ✅ Clicked 'Continue' button: '{result.get('text', '')}'")
-                    continue_clicked = True
-                else:
-                    print(f"   ❌ Could not find 'Continue' button")
-                    return False
-                    
-            except Exception as e:
-                print(f"   ❌ JavaScript execution failed: {e}")
+            if result['continueText'] is None:
+                print(f"   ❌ Could not find 'Continue' button")
                 return False
+            print(f"   ✅ Clicked 'Continue' button: '{result['continueText']}'")
             
-            # Step 5: Wait 90 seconds for stock media matching to complete
-            print("5️⃣ Waiting 90 seconds for stock media matching to complete...")
-            wait_time = 90
-            for i in range(wait_time):
-                remaining = wait_time - i
-                if remaining % 10 == 0 or remaining <= 5:
-                    print(f"   ⏱️  {remaining} seconds remaining...")
-                time.sleep(1)
+            # Step 5: Wait (up to 90 seconds) for stock media matching to complete
+            print("5️⃣ Waiting up to 90 seconds for stock media matching to complete...")
+            waited = self._wait_while_busy(self.MATCHING_BUSY_SELECTOR, max_wait=90)
             
-            print("✅ Stock media matching completed!")
+            print(f"✅ Stock media matching completed! ({waited:.0f}s)")
             return True
             
         except Exception as e:
             print(f"❌ Stock media matching failed: {e}")
             return False
     
+    def _human_wait(self, min_s: float = 0.2, max_s: float = 0.6,
+                    wait_selector: Optional[str] = None, timeout: float = 10):
+        """
+        Short randomised pause before a click, after the target has rendered.
+        
+        Args:
+            min_s: Shortest pause in seconds
+            max_s: Longest pause in seconds
+            wait_selector: Selector to wait for (visible) before pausing
+            timeout: Seconds to wait for wait_selector before pausing anyway
+        """
+        if wait_selector:
+            try:
+                self.current_page.wait_for_selector(wait_selector, state='visible', timeout=timeout * 1000)
+            except PlaywrightTimeoutError:
+                logger.debug(f"   ⚠️  Not visible after {timeout}s: {wait_selector}")
+        time.sleep(random.uniform(min_s, max_s))
+    
+    def _wait_while_busy(self, busy_selector: str, max_wait: int, appear_timeout: int = 10) -> float:
+        """
+        Wait for a background CapCut task to finish, returning as soon as it does.
+        
+        Waits for a visible progress indicator, then for it to go away. If no
+        indicator shows up the full max_wait is spent, as a fixed wait would.
+        
+        Args:
+            busy_selector: CSS selector for the task's progress UI
+            max_wait: Upper bound in seconds
+            appear_timeout: Seconds to wait for the progress UI to show up
+            
+        Returns:
+            Seconds waited
+        """
+        start = time.time()
+        try:
+            # Also loads the page helpers the waits below rely on
+            if not self._page_helper('anyVisible', busy_selector):
+                self.current_page.wait_for_function(
+                    "(selector) => window.__cc.anyVisible(selector)",
+                    arg=busy_selector, timeout=appear_timeout * 1000, polling=250
+                )
+            logger.debug("   ⏳ Progress indicator visible, waiting for it to clear...")
+            remaining = max(max_wait - (time.time() - start), 1)
+            self.current_page.wait_for_function(
+                "(selector) => !window.__cc.anyVisible(selector)", arg=busy_selector,
+                timeout=remaining * 1000, polling=500
+            )
+            return time.time() - start
+        except PlaywrightTimeoutError:
+            pass
+        
+        remaining = max_wait - (time.time() - start)
+        if remaining > 0:
+            logger.debug(f"   ⏱️  No progress indicator seen, waiting the remaining {remaining:.0f}s")
+            time.sleep(remaining)
+        return time.time() - start
+    
+    # Playwright's :has-text('...') on the last compound of a selector, e.g.
+    # "button:has-text('Export'):not(.x)"; anything after it must not be a combinator
+    HAS_TEXT = re.compile(r":has-text\('([^']*)'\)")
+    
+    @classmethod
+    def _split_has_text(cls, selector: str) -> Optional[Dict[str, str]]:
+        """Split a selector into plain CSS plus has-text text, or None if it can't be."""
+        matches = list(cls.HAS_TEXT.finditer(selector))
+        if not matches:
+            return {'css': selector, 'text': ''}
+        if len(matches) > 1:
+            return None
+        match = matches[0]
+        rest = selector[match.end():]
+        depth = 0
+        for ch in rest:
+            if ch == '(':
+                depth += 1
+            elif ch == ')':
+                depth -= 1
+            elif depth == 0 and (ch.isspace() or ch in '>+~'):
+                return None
+        return {'css': selector[:match.start()] + rest, 'text': match.group(1)}
+    
+    def _first_visible(self, selectors: List[str]) -> Optional[Dict[str, Any]]:
+        """
+        Find the first visible element matching any selector, in one page call.
+        
+        Selectors the page can't evaluate (has-text inside a combinator chain)
+        are checked with Playwright afterwards.
+        
+        Args:
+            selectors: Playwright selectors in priority order
+            
+        Returns:
+            Dict with selector, index (nth match of that selector) and text, or None
+        """
+        key = tuple(selectors)
+        if key not in self.selector_specs:
+            specs = []
+            unsupported = []
+            for selector in selectors:
+                spec = self._split_has_text(selector)
+                if spec is None:
+                    unsupported.append(selector)
+                else:
+                    specs.append(dict(spec, selector=selector))
+            self.selector_specs[key] = (specs, unsupported)
+        specs, unsupported = self.selector_specs[key]
+        
+        found = self._page_helper('scanSelectors', specs) if specs else None
+        if found:
+            return found
+        
+        for selector in unsupported:
+            try:
+                element = self._loc(selector).first
+                if element.is_visible():
+                    return {'selector': selector, 'index': 0, 'text': element.text_content() or ''}
+            except Exception as e:
+                logger.debug(f"   ❌ Selector failed: {selector}: {e}")
+        return None
+    
+    def _click_found(self, found: Dict[str, Any]):
+        """Click an element returned by _first_visible()."""
+        self._loc(found['selector']).nth(found['index']).click()
+    
+    def _loc(self, selector: str):
+        """
+        Locator for selector on the current page, reused until the page or its URL changes.
+        
+        Args:
+            selector: Playwright selector
+        """
+        key = (self.current_page, self.current_page.url, selector)
+        locator = self.locator_cache.get(key)
+        if locator is None:
+            if len(self.locator_cache) > 256:
+                self.locator_cache.clear()
+            locator = self.locator_cache[key] = self.current_page.locator(selector)
+        return locator
+    
+    def _safe_page_helper(self, label: str, name: str, *args):
+        """
+        _page_helper() that logs failures instead of raising.
+        
+        Args:
+            label: What the call does, for the log line
+            name: window.__cc helper name
+            
+        Returns:
+            The helper's result, or None if the call failed
+        """
+        try:
+            return self._page_helper(name, *args)
+        except Exception as e:
+            logger.warning(f"   ❌ {label} failed: {e}")
+            return None
+    
+    def _page_helper(self, name: str, *args):
+        """
+        Call one of the window.__cc helpers on the current page.
+        
+        Documents loaded before the init script was registered get the
+        helpers injected on first use.
+        """
+        call = "([name, args]) => window.__cc ? window.__cc[name](...args) : { missing: true }"
+        result = self.current_page.evaluate(call, [name, list(args)])
+        if isinstance(result, dict) and result.get('missing'):
+            self.current_page.evaluate(self.PAGE_HELPERS_JS)
+            result = self.current_page.evaluate(call, [name, list(args)])
+        return result
+    
     def set_video_customizations(self, job: Dict[str, Any]) -> bool:
         """
         SIMPLE: Set video customization options using the same methods as fill_form().
@@ -895,28 +1157,28 @@ class CapCutOrchestrator:
         try:
             print(f"⚙️ Setting customizations for: {job['title']}")
             
-            # Wait a bit for the form to be ready
-            time.sleep(2)
-            
-            # Set aspect ratio using the same method as fill_form
-            if 'aspect_ratio' in job:
-                print(f"📐 Setting aspect ratio: {job['aspect_ratio']}")
-                self._set_aspect_ratio(job['aspect_ratio'])
-            
-            # Set voice using the same method as fill_form
-            if 'voice' in job:
-                print(f"🎤 Setting voice: {job['voice']}")
-                self._set_voice(job['voice'])
+            # Wait for the form to be ready
+            try:
+                self.current_page.wait_for_selector("textarea", state="visible", timeout=5000)
+            except PlaywrightTimeoutError:
+                pass
             
-            # Set visual style using the same method as fill_form
-            if 'visual_style' in job:
-                print(f"🎨 Setting visual style: {job['visual_style']}")
-                self._set_visual_style(job['visual_style'])
+            # Find and set all dropdowns in one page call, then fall back to
+            # the per-field helpers for any the batch missed
+            applied = self._apply_form_batch(job)
             
-            # Set duration using the same method as fill_form
-            if 'duration' in job:
-                print(f"⏱️ Setting duration: {job['duration']}")
-                self._set_duration(job['duration'])
+            field_setters = [
+                ('aspect_ratio', '📐 Setting aspect ratio', self._set_aspect_ratio),
+                ('voice', '🎤 Setting voice', self._set_voice),
+                ('visual_style', '🎨 Setting visual style', self._set_visual_style),
+                ('duration', '⏱️ Setting duration', self._set_duration)
+            ]
+            for field, label, setter in field_setters:
+                if field not in job:
+                    continue
+                print(f"{label}: {job[field]}")
+                if not applied.get(field):
+                    setter(job[field])
             
             print("✅ Customizations completed!")
             return True
@@ -936,16 +1198,12 @@ class CapCutOrchestrator:
                 f"button[aria-label*='{dropdown_type}' i]"
             ]
             
-            for selector in dropdown_selectors:
-                try:
-                    elements = self.current_page.locator(selector)
-                    if elements.count() > 0 and elements.first.is_visible():
-                        print(f"   ✅ Found {dropdown_type}: {value}")
-                        elements.first.click()
-                        time.sleep(1)
-                        return True
-                except Exception:
-                    continue
+            found = self._first_visible(dropdown_selectors)
+            if found:
+                print(f"   ✅ Found {dropdown_type}: {value}")
+                self._click_found(found)
+                time.sleep(1)
+                return True
             
             print(f"   ⚠️ Could not find {dropdown_type}: {value}")
             return True  # Don't fail the whole process for this
@@ -964,14 +1222,16 @@ class CapCutOrchestrator:
         Returns:
             True if export completed successfully
         """
+        filename = (job.get('title') or 'video').strip()[:45]  # CapCut allows at most 45 characters
+        
         try:
             print("📤 Starting video export process...")
             
             # Step 1: Click the TOP-RIGHT Export button (opens dialog)
             print("1️⃣ Looking for TOP-RIGHT Export button to open dialog...")
             
-            # Wait a bit to ensure page is ready
-            time.sleep(2)
+            # Wait for an Export button to render
+            self._human_wait(wait_selector="button:has-text('Export')")
             
             # Look specifically for the top-right Export button (not in dialog)
             top_export_selectors = [
@@ -985,26 +1245,14 @@ class CapCutOrchestrator:
             export_dialog_opened = False
             print("   🔍 Looking for TOP-RIGHT Export button...")
             
-            for selector in top_export_selectors:
-                try:
-                    print(f"   Trying: {selector}")
-                    buttons = self.current_page.locator(selector)
-                    count = buttons.count()
-                    print(f"   Found {count} elements")
-                    
-                    if count > 0:
-                        # Click the first visible Export button (should be top-right)
-                        button = buttons.first
-                        if button.is_visible():
-                            button_text = button.text_content() or ""
-                            print(f"   ✅ Found TOP Export button: '{button_text}'")
-                            button.click()
-                            export_dialog_opened = True
-                            print("   ✅ Clicked TOP Export button - dialog should open!")
-                            break
-                except Exception as e:
-                    print(f"   ❌ Selector failed: {e}")
-                    continue
+            # First visible Export button (should be top-right)
+            found = self._first_visible(top_export_selectors)
+            if found:
+                logger.debug(f"   Matched: {found['selector']}")
+                print(f"   ✅ Found TOP Export button: '{found['text']}'")
+                self._click_found(found)
+                export_dialog_opened = True
+                print("   ✅ Clicked TOP Export button - dialog should open!")
             
             if not export_dialog_opened:
                 print("❌ Could not find TOP Export button")
@@ -1012,11 +1260,10 @@ class CapCutOrchestrator:
             
             # Wait for export dialog to open
             print("   ⏳ Waiting for export dialog to open...")
-            time.sleep(3)
+            self._human_wait(wait_selector="input[placeholder*='name' i], [role='dialog']", timeout=3)
             
             # Step 2: Set file name (max 45 characters)
             print("2️⃣ Setting file name...")
-            filename = job['title'][:45]  # Limit to 45 characters
             filename_selectors = [
                 "input[placeholder*='file name' i]",
                 "input[placeholder*='name' i]",
@@ -1024,27 +1271,23 @@ class CapCutOrchestrator:
                 "input[type='text']"
             ]
             
-            for selector in filename_selectors:
-                try:
-                    input_field = self.current_page.locator(selector).first
-                    if input_field.is_visible():
-                        input_field.click()
-                        input_field.fill("")  # Clear
-                        input_field.fill(filename)
-                        print(f"   ✅ Set filename: {filename}")
-                        break
-                except Exception:
-                    continue
+            found = self._first_visible(filename_selectors)
+            if found:
+                # fill() focuses and replaces the current value in one step
+                self._loc(found['selector']).nth(found['index']).fill(filename)
+                print(f"   ✅ Set filename: {filename}")
             
             # Step 3: Skip resolution/framerate selection (not working reliably)
             # CapCut will use default settings (usually 1080p @ 30fps)
             print("3️⃣ Skipping resolution/framerate selection (using CapCut defaults)...")
             print("   ℹ️  Note: CapCut will export with default quality settings")
-            time.sleep(1)
             
             # Step 4: Click the BOTTOM Export button (in the dialog/popup)
             print("5️⃣ Looking for BOTTOM Export button in the dialog...")
-            time.sleep(2)
+            self._human_wait(
+                wait_selector="[role='dialog'] button:has-text('Export'), [class*='modal'] button:has-text('Export')",
+                timeout=3
+            )
             
             # Look specifically for the Export button INSIDE the dialog/popup
             dialog_export_selectors = [
@@ -1060,69 +1303,56 @@ class CapCutOrchestrator:
             dialog_export_clicked = False
             print("   🔍 Looking for Export button INSIDE the dialog...")
             
-            # Debug: Show all Export buttons and their locations
-            try:
-                all_export_buttons = self.current_page.locator("button:has-text('Export')").all()
-                print(f"   📊 Found {len(all_export_buttons)} total Export buttons:")
-                for i, button in enumerate(all_export_buttons):
-                    try:
-                        if button.is_visible():
-                            # Get button location/context
-                            box = button.bounding_box()
-                            text = button.text_content() or ""
-                            print(f"   Button {i+1}: '{text}' at position {box}")
-                    except Exception:
-                        continue
-            except Exception:
-                pass
-            
             # Try dialog-specific selectors first
-            for selector in dialog_export_selectors:
-                try:
-                    print(f"   Trying dialog selector: {selector}")
-                    buttons = self.current_page.locator(selector)
-                    count = buttons.count()
-                    print(f"   Found {count} dialog Export buttons")
-                    
-                    if count > 0:
-                        button = buttons.first
-                        if button.is_visible():
-                            button_text = button.text_content() or ""
-                            print(f"   ✅ Found DIALOG Export button: '{button_text}'")
-                            button.click()
-                            dialog_export_clicked = True
-                            print("   ✅ Clicked DIALOG Export button - export should start!")
-                            break
-                except Exception as e:
-                    print(f"   ❌ Dialog selector failed: {e}")
-                    continue
+            found = self._first_visible(dialog_export_selectors)
+            if found:
+                logger.debug(f"   Matched dialog selector: {found['selector']}")
+                print(f"   ✅ Found DIALOG Export button: '{found['text']}'")
+                self._click_found(found)
+                dialog_export_clicked = True
+                print("   ✅ Clicked DIALOG Export button - export should start!")
             
             # If no dialog button found, try the second Export button (bottom one)
             if not dialog_export_clicked:
                 print("   🔄 No dialog Export found, trying second Export button...")
+                
+                # Debug: Show all Export buttons and their locations, to see why none matched
+                if logger.isEnabledFor(logging.DEBUG):
+                    try:
+                        all_export_buttons = self.current_page.evaluate("""
+                            () => Array.from(document.querySelectorAll('button'))
+                                .filter(b => (b.textContent || '').toLowerCase().includes('export'))
+                                .map((b, i) => {
+                                    if (b.offsetParent === null) return null;
+                                    const r = b.getBoundingClientRect();
+                                    return {
+                                        index: i + 1,
+                                        text: b.textContent || '',
+                                        box: { x: r.x, y: r.y, width: r.width, height: r.height }
+                                    };
+                                })
+                        """)
+                        logger.debug(f"   📊 Found {len(all_export_buttons)} total Export buttons:")
+                        for button in filter(None, all_export_buttons):
+                            logger.debug(f"   Button {button['index']}: '{button['text']}' at position {button['box']}")
+                    except Exception:
+                        pass
+                
                 try:
-                    all_export_buttons = self.current_page.locator("button:has-text('Export')")
+                    all_export_buttons = self._loc("button:has-text('Export')")
                     count = all_export_buttons.count()
-                    print(f"   Found {count} total Export buttons")
+                    logger.debug(f"   Found {count} total Export buttons")
                     
-                    if count >= 2:
-                        # Click the second Export button (should be the dialog one)
-                        second_button = all_export_buttons.nth(1)  # Index 1 = second button
-                        if second_button.is_visible():
-                            button_text = second_button.text_content() or ""
-                            print(f"   ✅ Clicking SECOND Export button: '{button_text}'")
-                            second_button.click()
-                            dialog_export_clicked = True
-                            print("   ✅ Clicked second Export button!")
-                    elif count == 1:
-                        # Only one Export button - might be the dialog one now
-                        button = all_export_buttons.first
-                        if button.is_visible():
-                            button_text = button.text_content() or ""
-                            print(f"   ✅ Clicking single Export button: '{button_text}'")
-                            button.click()
-                            dialog_export_clicked = True
-                            print("   ✅ Clicked Export button!")
+                    if count:
+                        # Second Export button should be the dialog one; with only one,
+                        # it might be the dialog one now
+                        which = 'SECOND' if count >= 2 else 'single'
+                        # click() waits for visibility itself, so no is_visible()/text_content() first
+                        all_export_buttons.nth(1 if count >= 2 else 0).click(timeout=1500)
+                        dialog_export_clicked = True
+                        print(f"   ✅ Clicked {which} Export button!")
+                except PlaywrightTimeoutError:
+                    print("   ❌ Fallback failed: Export button never became clickable")
                 except Exception as e:
                     print(f"   ❌ Fallback failed: {e}")
             
@@ -1133,14 +1363,11 @@ class CapCutOrchestrator:
             print("✅ Export process initiated!")
             print("📥 Video export started...")
             
-            # Wait 1 minute for export to complete
-            print("⏳ Waiting 1 minute for export to complete...")
-            for i in range(60):
-                remaining = 60 - i
-                print(f"   ⏱️ Export time remaining: {remaining} seconds", end='\r')
-                time.sleep(1)
+            # Wait (up to 1 minute) for export to complete
+            print("⏳ Waiting up to 1 minute for export to complete...")
+            waited = self._wait_while_busy(self.EXPORT_BUSY_SELECTOR, max_wait=60)
             
-            print("\n✅ Export completed!")
+            print(f"✅ Export completed! ({waited:.0f}s)")
             
             # Now download the video from My Cloud
             print("\n" + "=" * 60)
@@ -1200,34 +1427,33 @@ class CapCutOrchestrator:
             dropdown_opened = False
             
             # Try to find and click dropdown button
-            for selector in dropdown_button_selectors:
+            found = self._first_visible(dropdown_button_selectors)
+            if found:
+                logger.debug(f"   Matched dropdown button: {found['selector']}")
+                print(f"   ✅ Found dropdown button: '{found['text']}'")
+                self._click_found(found)
+                dropdown_opened = True
+                print(f"   ✅ Clicked {dropdown_type} dropdown - should open options")
                 try:
-                    print(f"   Trying dropdown button: {selector}")
-                    buttons = self.current_page.locator(selector)
-                    count = buttons.count()
-                    print(f"   Found {count} elements")
-                    
-                    if count > 0:
-                        button = buttons.first
-                        if button.is_visible():
-                            button_text = button.text_content() or ""
-                            print(f"   ✅ Found dropdown button: '{button_text}'")
-                            button.click()
-                            dropdown_opened = True
-                            print(f"   ✅ Clicked {dropdown_type} dropdown - should open options")
-                            time.sleep(1)  # Wait for dropdown to open
-                            break
-                except Exception as e:
-                    print(f"   ❌ Button selector failed: {e}")
-                    continue
+                    self.current_page.wait_for_selector(self.DROPDOWN_MENU_SELECTOR, state="visible", timeout=2000)
+                except PlaywrightTimeoutError:
+                    logger.debug("   ⚠️  No dropdown popup seen")
             
             if not dropdown_opened:
                 print(f"   ⚠️ Could not find {dropdown_type} dropdown button")
                 return True  # Don't fail export for this
             
-            # Step 2: Find and click the desired option
+            # Step 2: Find and click the desired option, inside the open popup if
+            # there is one, otherwise anywhere on the page
             print(f"   🎯 Looking for option: {value}")
             
+            menu_result = self._page_helper('clickMenuOption', self.DROPDOWN_MENU_SELECTOR, value)
+            if menu_result.get('text') is not None:
+                print(f"   ✅ Found option: '{menu_result['text']}'")
+                print(f"   ✅ Selected {dropdown_type}: {value}")
+                time.sleep(1)  # Wait for selection to register
+                return True
+            
             option_selectors = [
                 f"div[role='option']:has-text('{value}')",
                 f"li:has-text('{value}')",
@@ -1239,44 +1465,37 @@ class CapCutOrchestrator:
             
             option_clicked = False
             
-            for selector in option_selectors:
-                try:
-                    print(f"   Trying option: {selector}")
-                    options = self.current_page.locator(selector)
-                    count = options.count()
-                    print(f"   Found {count} option elements")
-                    
-                    if count > 0:
-                        option = options.first
-                        if option.is_visible():
-                            option_text = option.text_content() or ""
-                            print(f"   ✅ Found option: '{option_text}'")
-                            option.click()
-                            option_clicked = True
-                            print(f"   ✅ Selected {dropdown_type}: {value}")
-                            time.sleep(1)  # Wait for selection to register
-                            break
-                except Exception as e:
-                    print(f"   ❌ Option selector failed: {e}")
-                    continue
+            found = self._first_visible(option_selectors)
+            if found:
+                logger.debug(f"   Matched option: {found['selector']}")
+                print(f"   ✅ Found option: '{found['text']}'")
+                self._click_found(found)
+                option_clicked = True
+                print(f"   ✅ Selected {dropdown_type}: {value}")
+                time.sleep(1)  # Wait for selection to register
             
             if not option_clicked:
                 print(f"   ⚠️ Could not find option '{value}' for {dropdown_type}")
                 
                 # Debug: Show all available options
-                try:
-                    print(f"   🔍 Available options in dropdown:")
-                    all_options = self.current_page.locator("div[role='option'], li, button").all()
-                    for i, option in enumerate(all_options[:10]):  # Show first 10
-                        try:
-                            if option.is_visible():
-                                text = option.text_content() or ""
-                                if text.strip():
-                                    print(f"   Option {i+1}: '{text.strip()}'")
-                        except Exception:
-                            continue
-                except Exception:
-                    pass
+                if menu_result.get('options') is not None:
+                    logger.debug(f"   🔍 Available options in dropdown:")
+                    for i, text in enumerate(menu_result['options']):
+                        if text:
+                            logger.debug(f"   Option {i+1}: '{text}'")
+                elif logger.isEnabledFor(logging.DEBUG):
+                    try:
+                        logger.debug(f"   🔍 Available options in dropdown:")
+                        all_options = self.current_page.evaluate("""
+                            () => Array.from(document.querySelectorAll("div[role='option'], li, button"))
+                                .slice(0, 10)  // Show first 10
+                                .map(o => o.offsetParent !== null ? (o.textContent || '').trim() : '')
+                        """)
+                        for i, text in enumerate(all_options):
+                            if text:
+                                logger.debug(f"   Option {i+1}: '{text}'")
+                    except Exception:
+                        pass
                 
                 # Try to close dropdown by clicking elsewhere
                 try:
@@ -1296,51 +1515,49 @@ class CapCutOrchestrator:
         try:
             print(f"   🔄 Alternative {dropdown_type} selection for: {target_value}")
             
-            # Look for any buttons/elements with the possible values
+            # Find whichever possible value is currently shown, in one page scan
+            value_by_selector = {}
             for current_value in possible_values:
+                for selector in (
+                    f"button:has-text('{current_value}')",
+                    f"div:has-text('{current_value}')",
+                    f"span:has-text('{current_value}')",
+                    f"[role='button']:has-text('{current_value}')"
+                ):
+                    value_by_selector.setdefault(selector, current_value)
+            
+            found = self._first_visible(list(value_by_selector))
+            if found:
+                current_value = value_by_selector[found['selector']]
+                print(f"   ✅ Found current {dropdown_type}: {current_value}")
+                
+                # Click to open dropdown
+                self._click_found(found)
                 try:
-                    print(f"   Looking for current value: {current_value}")
-                    
-                    # Find elements showing current value
-                    current_value_selectors = [
-                        f"button:has-text('{current_value}')",
-                        f"div:has-text('{current_value}')",
-                        f"span:has-text('{current_value}')",
-                        f"[role='button']:has-text('{current_value}')"
-                    ]
-                    
-                    for selector in current_value_selectors:
-                        elements = self.current_page.locator(selector)
-                        if elements.count() > 0 and elements.first.is_visible():
-                            print(f"   ✅ Found current {dropdown_type}: {current_value}")
-                            
-                            # Click to open dropdown
-                            elements.first.click()
-                            time.sleep(1)
-                            
-                            # Now look for the target value in the opened dropdown
-                            target_selectors = [
-                                f"div[role='option']:has-text('{target_value}')",
-                                f"li:has-text('{target_value}')",
-                                f"button:has-text('{target_value}')",
-                                f"div:has-text('{target_value}')"
-                            ]
-                            
-                            for target_selector in target_selectors:
-                                target_elements = self.current_page.locator(target_selector)
-                                if target_elements.count() > 0 and target_elements.first.is_visible():
-                                    print(f"   🎯 Found target option: {target_value}")
-                                    target_elements.first.click()
-                                    print(f"   ✅ Selected {dropdown_type}: {target_value}")
-                                    return True
-                            
-                            # If target not found, close dropdown
-                            self.current_page.keyboard.press("Escape")
-                            break
-                            
-                except Exception as e:
-                    print(f"   ❌ Alternative method failed for {current_value}: {e}")
-                    continue
+                    self.current_page.wait_for_selector(self.DROPDOWN_MENU_SELECTOR, state="visible", timeout=1000)
+                except PlaywrightTimeoutError:
+                    pass
+                
+                # Now look for the target value in the opened dropdown
+                menu_result = self._page_helper('clickMenuOption', self.DROPDOWN_MENU_SELECTOR, target_value)
+                selected = menu_result.get('text') is not None
+                if not selected:
+                    target = self._first_visible([
+                        f"div[role='option']:has-text('{target_value}')",
+                        f"li:has-text('{target_value}')",
+                        f"button:has-text('{target_value}')",
+                        f"div:has-text('{target_value}')"
+                    ])
+                    if target:
+                        self._click_found(target)
+                        selected = True
+                if selected:
+                    print(f"   🎯 Found target option: {target_value}")
+                    print(f"   ✅ Selected {dropdown_type}: {target_value}")
+                    return True
+                
+                # If target not found, close dropdown
+                self.current_page.keyboard.press("Escape")
             
             print(f"   ⚠️ Alternative {dropdown_type} selection failed")
             return False
@@ -1415,6 +1632,7 @@ class CapCutOrchestrator:
             # Step 5: Click Generate button
             job_state.current_step = "click_generate"
             print("🎯 Now clicking Generate button...")
+            self.opened_pages.clear()
             if not self.click_generate_button():
                 raise Exception("Failed to click Generate button")
             
@@ -1426,6 +1644,9 @@ class CapCutOrchestrator:
             if not self.handle_generation_page_navigation():
                 raise Exception("Failed to navigate to generation page")
             
+            # Open the status worksheet while CapCut generates, ready for the final writeback
+            self.status_worksheet_future = self.background.submit(self._open_status_worksheet)
+            
             # Step 7: Wait for video generation to complete
             job_state.current_step = "wait_for_generation"
             print("🎬 CapCut AI is generating the video...")
@@ -1583,7 +1804,8 @@ class CapCutOrchestrator:
         finally:
             # Cleanup
             if self.browser_context:
-                self.browser_context.close()
+                self.browser_manager.release_context()
+            self.background.shutdown(wait=False)
     
     def print_final_report(self):
         """Print final automation report."""
@@ -1634,51 +1856,58 @@ class CapCutOrchestrator:
                 print("   ❌ Google Sheets ID not configured in .env")
                 return False
                 
-            sheet_name = self.sheets_reader.google_sheet_name or 'Sheet1'
+            worksheet = None
+            if self.status_worksheet_future is not None:
+                try:
+                    worksheet = self.status_worksheet_future.result()
+                except Exception as e:
+                    print(f"   ⚠️  Prefetched worksheet unavailable: {e}")
+                self.status_worksheet_future = None  # Retries reopen it
+            if worksheet is None:
+                worksheet = self._open_status_worksheet()
             
-            # Open the spreadsheet
-            print(f"   📂 Opening spreadsheet: {sheets_id}")
-            spreadsheet = self.sheets_reader.gspread_client.open_by_key(sheets_id)
-            worksheet = spreadsheet.worksheet(sheet_name)
+            from gspread.utils import rowcol_to_a1
             
-            # Get headers to locate columns
-            headers = worksheet.row_values(1)
-            print(f"   📋 Found columns: {headers}")
+            # One read for headers and rows alike
+            all_values = worksheet.get_all_values()
+            headers = all_values[0] if all_values else []
+            logger.debug(f"   📋 Found columns: {headers}")
             
-            def col_index(name: str, default_new: bool = False) -> int:
-                try:
-                    return headers.index(name) + 1
-                except ValueError:
-                    if default_new:
-                        # Append new header at the end
-                        print(f"   ➕ Adding new column: {name}")
-                        headers.append(name)
-                        worksheet.update_cell(1, len(headers), name)
-                        return len(headers)
-                    raise ValueError(f"Column '{name}' not found in sheet")
-            
-            # Get video_generation column index
+            # Header and status cells are written together in one batch update
+            updates = []
             try:
-                generation_col = col_index('video_generation')
+                generation_col = headers.index('video_generation') + 1
             except ValueError:
                 print("   ⚠️  'video_generation' column not found, creating it...")
-                generation_col = col_index('video_generation', default_new=True)
-
-            # Get all records to find the matching row
-            print(f"   🔍 Searching for job: '{job_title}'")
-            records = worksheet.get_all_records()
-            
-            for i, record in enumerate(records, start=2):  # Start at row 2 (after header)
-                record_title = str(record.get('title', '')).strip()
-                if record_title.lower() == job_title.strip().lower():  # Case-insensitive match
+                print("   ➕ Adding new column: video_generation")
+                generation_col = len(headers) + 1
+                updates.append({
+                    'range': rowcol_to_a1(1, generation_col),
+                    'values': [['video_generation']]
+                })
+            
+            # Find the matching row
+            logger.debug(f"   🔍 Searching for job: '{job_title}'")
+            title_col = headers.index('title') if 'title' in headers else None
+            titles = [
+                row[title_col] if title_col is not None and title_col < len(row) else ''
+                for row in all_values[1:]
+            ]
+            for i, record_title in enumerate(titles, start=2):  # Start at row 2 (after header)
+                if record_title.strip().lower() == job_title.strip().lower():  # Case-insensitive match
                     print(f"   ✅ Found matching row: {i}")
                     # Update video_generation status
-                    worksheet.update_cell(i, generation_col, status)
+                    updates.append({
+                        'range': rowcol_to_a1(i, generation_col),
+                        'values': [[status]]
+                    })
+                    worksheet.batch_update(updates)
+                    self.sheets_reader.invalidate_cache()
                     print(f"   ✅ Updated row {i}: video_generation='{status}'")
                     return True
             
             print(f"   ❌ Could not find job '{job_title}' in Google Sheet")
-            print(f"   📋 Available titles: {[r.get('title', '') for r in records[:5]]}...")
+            print(f"   📋 Available titles: {titles[:5]}...")
             return False
             
         except Exception as e:
@@ -1687,6 +1916,54 @@ class CapCutOrchestrator:
             traceback.print_exc()
             return False
 
+    def _open_status_worksheet(self):
+        """Open the configured worksheet that holds the video_generation column."""
+        sheets_id = self.sheets_reader.google_sheets_id
+        sheet_name = self.sheets_reader.google_sheet_name or 'Sheet1'
+        logger.debug(f"   📂 Opening spreadsheet: {sheets_id}")
+        spreadsheet = self.sheets_reader.gspread_client.open_by_key(sheets_id)
+        return spreadsheet.worksheet(sheet_name)
+
+    def _apply_form_batch(self, job: Dict[str, Any]) -> Dict[str, bool]:
+        """
+        Set every form dropdown with a single window.__cc.applyForm call.
+        
+        Args:
+            job: Job data dictionary (fields it doesn't have are left alone)
+            
+        Returns:
+            Dict of field name -> whether the batch managed to set it
+        """
+        values = {
+            name: job[name] for name in ('visual_style', 'voice', 'duration', 'aspect_ratio')
+            if name in job
+        }
+        if 'duration' in values:
+            values['duration'] = self._capcut_duration(values['duration'])
+        fields = [
+            {'name': name, 'value': str(value), 'openers': self.FORM_DROPDOWN_OPENERS[name]}
+            for name, value in values.items()
+        ]
+        applied = self._safe_page_helper('Batched form fill', 'applyForm', fields) or {}
+        
+        if not all(applied.get(name) for name in values):
+            # Close any dropdown left open before the per-field helpers run
+            try:
+                self.current_page.keyboard.press("Escape")
+            except Exception:
+                pass
+        return applied
+    
+    @staticmethod
+    def _capcut_duration(duration) -> str:
+        """Convert a duration in seconds to CapCut's dropdown label ("30s", "1 min")."""
+        if isinstance(duration, int) or str(duration).isdigit():
+            seconds = int(duration)
+            if seconds < 60:
+                return f"{seconds}s"
+            return f"{seconds // 60} min"
+        return duration
+    
     def _set_visual_style(self, visual_style: str) -> bool:
         """
         Set the visual style dropdown in CapCut.
@@ -1826,35 +2103,13 @@ class CapCutOrchestrator:
             # STEP 2: Use JavaScript to find and click the voice (most reliable for virtual lists)
             print(f"   Step 2: Using JavaScript to find '{voice}'...")
             
-            try:
-                # JavaScript approach - searches ALL elements including lazy-loaded ones
-                result = self.current_page.evaluate(f"""
-                    (voiceName) => {{
-                        // Find all elements with the voice name
-                        const allElements = Array.from(document.querySelectorAll('*'));
-                        const matches = allElements.filter(el => {{
-                            const text = el.textContent?.trim() || '';
-                            return text === voiceName && el.offsetParent !== null;
-                        }});
-                        
-                        if (matches.length > 0) {{
-                            // Click the first match
-                            matches[0].click();
-                            return {{ success: true, found: matches.length }};
-                        }}
-                        
-                        return {{ success: false, found: 0 }};
-                    }}
-                """, voice)
-                
-                if result.get('success'):
-                    print(f"   ✅ Found and clicked '{voice}' with JavaScript (found {result['found']} matches)")
-                    time.sleep(1)
-                    return True
-                else:
-                    print(f"   ⚠️  Voice not immediately visible, will try scrolling...")
-            except Exception as e:
-                print(f"   ⚠️  JavaScript method failed: {e}")
+            # JavaScript approach - searches ALL elements including lazy-loaded ones
+            result = self._safe_page_helper('Voice lookup', 'clickByText', voice)
+            if result and result.get('success'):
+                print(f"   ✅ Found and clicked '{voice}' with JavaScript")
+                time.sleep(1)
+                return True
+            print(f"   ⚠️  Voice not immediately visible, will try scrolling...")
             
             # STEP 3: Scroll through virtual list to load and find the voice
             print(f"   Step 3: Scrolling through virtual list...")
@@ -1895,7 +2150,7 @@ class CapCutOrchestrator:
                         
                         # If scroll position hasn't changed, we might be at the bottom
                         if current_scroll == previous_scroll_top:
-                            print(f"   📍 Scroll position unchanged, likely at bottom")
+                            logger.debug(f"   📍 Scroll position unchanged, likely at bottom")
                             break
                         
                         previous_scroll_top = current_scroll
@@ -1904,21 +2159,7 @@ class CapCutOrchestrator:
                     
                     # Try to find the voice at current scroll position using JavaScript
                     try:
-                        found = self.current_page.evaluate(f"""
-                            (voiceName) => {{
-                                const allElements = Array.from(document.querySelectorAll('*'));
-                                const matches = allElements.filter(el => {{
-                                    const text = el.textContent?.trim() || '';
-                                    return text === voiceName && el.offsetParent !== null;
-                                }});
-                                
-                                if (matches.length > 0) {{
-                                    matches[0].click();
-                                    return true;
-                                }}
-                                return false;
-                            }}
-                        """, voice)
+                        found = self._page_helper('clickByText', voice).get('success')
                         
                         if found:
                             print(f"   ✅ Found '{voice}' after {scroll_attempt} scrolls!")
@@ -1933,7 +2174,7 @@ class CapCutOrchestrator:
                         time.sleep(0.4)  # Wait for lazy loading
                         
                         if scroll_attempt % 5 == 0:
-                            print(f"   📜 Scrolled {scroll_attempt}/{max_scrolls} times...")
+                            logger.debug(f"   📜 Scrolled {scroll_attempt}/{max_scrolls} times...")
                     except Exception as e:
                         print(f"   ⚠️  Scroll error: {e}")
                         break
@@ -1984,13 +2225,7 @@ class CapCutOrchestrator:
         """
         try:
             # Convert seconds to CapCut format if needed
-            if isinstance(duration, int) or str(duration).isdigit():
-                seconds = int(duration)
-                if seconds < 60:
-                    duration = f"{seconds}s"
-                else:
-                    minutes = seconds // 60
-                    duration = f"{minutes} min"
+            duration = self._capcut_duration(duration)
             
             print(f"   Setting duration to: {duration}")
             
@@ -2171,7 +2406,7 @@ class CapCutOrchestrator:
             return True  # Don't fail the whole process for this
 
 
-def main():
+def main(argv=None):
     """SIMPLIFIED main entry point."""
     parser = argparse.ArgumentParser(description="CapCut Automation - SIMPLIFIED")
     
@@ -2183,12 +2418,19 @@ def main():
                        help='Simulate actions only')
     parser.add_argument('--headless', action='store_true',
                        help='Run browser headless')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Always refetch jobs from Google Sheets')
+    parser.add_argument('--verbose', action='store_true',
+                       help='Show selector/tab debug output')
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
+    
+    if args.verbose:
+        logger.setLevel(logging.DEBUG)
     
     try:
         # Check dependencies
-        if not MODULES_AVAILABLE or not PLAYWRIGHT_AVAILABLE:
+        if not load_modules():
             print("ERROR: Dependencies missing")
             print("Run: pip install -r requirements.txt && playwright install")
             return 1
@@ -2196,7 +2438,8 @@ def main():
         # Initialize orchestrator
         orchestrator = CapCutOrchestrator(
             dry_run=args.dry_run,
-            headless=args.headless
+            headless=args.headless,
+            use_sheets_cache=not args.no_cache
         )
         
         # Load jobs (always processes only 1 job)
@@ -2216,5 +2459,19 @@ def main():
         return 1
 
 
+def configure_console():
+    """Fix Windows console encoding for emoji support and flush output at each newline
+    for real-time console updates, even when stdout is a pipe"""
+    for stream in (sys.stdout, sys.stderr):
+        try:
+            if sys.platform == 'win32':
+                stream.reconfigure(encoding='utf-8', errors='strict', line_buffering=True)
+            else:
+                stream.reconfigure(line_buffering=True)
+        except (AttributeError, ValueError):
+            pass  # Replaced or detached stream (e.g. under a test runner)
+
+
 if __name__ == "__main__":
+    configure_console()
     exit(main())
@@ -9,6 +9,9 @@ import os
 import sys
 import json
 import time
+import signal
+import socket
+import subprocess
 from pathlib import Path
 from typing import Optional, Dict, Any
 from datetime import datetime
@@ -32,6 +35,9 @@ except ImportError:
     PLAYWRIGHT_AVAILABLE = False
 
 
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
 class ProvenBrowser:
     """
     Browser manager that uses our proven session JSON file.
@@ -53,7 +59,7 @@ class ProvenBrowser:
             load_dotenv()
         
         # Project paths (original behavior: state under project root parent)
-        self.project_root = Path(__file__).parent.parent
+        self.project_root = PROJECT_ROOT
         self.state_dir = self.project_root / "state"
         self.proven_session_file = self.state_dir / "proven_session.json"
         self.state_file = self.state_dir / "state.json"  # For compatibility
@@ -71,6 +77,12 @@ class ProvenBrowser:
         self.reuse_state = os.getenv('REUSE_STATE', 'true').lower() == 'true'
         self.force_per_job_relogin = os.getenv('FORCE_PER_JOB_RELOGIN', 'false').lower() == 'true'
         self.session_max_age = int(os.getenv('SESSION_MAX_AGE_SECONDS', '86400'))
+        
+        # Long-lived Chromium reached over CDP, so consecutive runs skip the cold start
+        self.persistent_browser = os.getenv('PERSISTENT_BROWSER', 'false').lower() == 'true'
+        self.cdp_port = int(os.getenv('BROWSER_CDP_PORT', '9222'))
+        self.persistent_profile_dir = self.state_dir / "pw_profile"
+        self.browser_process = None
     
     def check_proven_session(self) -> Dict[str, Any]:
         """
@@ -197,6 +209,15 @@ class ProvenBrowser:
             # Start Playwright
             self.playwright = sync_playwright().start()
             
+            if self.persistent_browser:
+                if not self.get_or_launch_persistent(headless):
+                    return None
+                if self.browser_process is None:
+                    # Already-running browser keeps its cookies in the profile
+                    print("♻️  Reusing running browser session")
+                    return self.context
+                return self._load_session_cookies(session_data)
+            
             # Launch browser
             self.browser = self.playwright.chromium.launch(
                 headless=headless,
@@ -207,11 +228,6 @@ class ProvenBrowser:
                 ]
             )
             
-            # Determine target website and domain from session data
-            website_url = session_data.get('website_url', 'https://www.capcut.com')
-            parsed = urlparse(website_url)
-            base_domain = parsed.netloc or 'www.capcut.com'
-            default_cookie_domain = '.' + base_domain.lstrip('.')
             user_agent = session_data.get('user_agent', 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
 
             # Create context
@@ -220,6 +236,21 @@ class ProvenBrowser:
                 user_agent=user_agent
             )
             
+            return self._load_session_cookies(session_data)
+            
+        except Exception as e:
+            print(f"❌ Failed to create Playwright context: {e}")
+            return None
+    
+    def _load_session_cookies(self, session_data: Dict[str, Any]) -> BrowserContext:
+        """Load the proven session cookies into self.context."""
+        try:
+            # Determine target website and domain from session data
+            website_url = session_data.get('website_url', 'https://www.capcut.com')
+            parsed = urlparse(website_url)
+            base_domain = parsed.netloc or 'www.capcut.com'
+            default_cookie_domain = '.' + base_domain.lstrip('.')
+            
             # Load cookies from session data
             if 'cookies' in session_data:
                 print("🍪 Loading cookies from proven session...")
@@ -266,6 +297,86 @@ class ProvenBrowser:
             print(f"❌ Failed to create Playwright context: {e}")
             return None
 
+    def _cdp_listening(self) -> bool:
+        """Check whether something is accepting connections on the CDP port."""
+        try:
+            with socket.create_connection(("127.0.0.1", self.cdp_port), timeout=0.5):
+                return True
+        except OSError:
+            return False
+    
+    def get_or_launch_persistent(self, headless: bool = False) -> Optional[BrowserContext]:
+        """
+        Attach to a long-lived Chromium over CDP, spawning it first if needed.
+        
+        The browser outlives this process so the next run skips the launch;
+        it is only torn down when this process receives SIGTERM.
+        
+        Returns:
+            The browser's default context or None if failed
+        """
+        try:
+            if not self._cdp_listening():
+                print(f"🚀 Launching persistent browser on CDP port {self.cdp_port}...")
+                self.persistent_profile_dir.mkdir(parents=True, exist_ok=True)
+                args = [
+                    self.playwright.chromium.executable_path,
+                    f"--remote-debugging-port={self.cdp_port}",
+                    f"--user-data-dir={self.persistent_profile_dir}",
+                    '--no-first-run',
+                    '--no-default-browser-check',
+                    '--no-sandbox',
+                    '--disable-dev-shm-usage',
+                    '--disable-blink-features=AutomationControlled',
+                    '--window-size=1280,720'
+                ]
+                if headless:
+                    args.append('--headless=new')
+                
+                # Own session so the browser survives this process exiting normally
+                self.browser_process = subprocess.Popen(
+                    args,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    start_new_session=True
+                )
+                signal.signal(signal.SIGTERM, self._terminate_persistent)
+                
+                deadline = time.time() + 15
+                while not self._cdp_listening():
+                    if time.time() > deadline or self.browser_process.poll() is not None:
+                        print("❌ Persistent browser did not open its CDP port")
+                        return None
+                    time.sleep(0.2)
+            
+            self.browser = self.playwright.chromium.connect_over_cdp(f"http://127.0.0.1:{self.cdp_port}")
+            self.context = self.browser.contexts[0] if self.browser.contexts else self.browser.new_context()
+            return self.context
+            
+        except Exception as e:
+            print(f"❌ Failed to attach to persistent browser: {e}")
+            return None
+    
+    def _terminate_persistent(self, signum, frame):
+        """SIGTERM handler: stop the browser we spawned, then exit."""
+        if self.browser_process and self.browser_process.poll() is None:
+            self.browser_process.terminate()
+        sys.exit(128 + signum)
+    
+    def release_context(self):
+        """Close the context, or just detach when it belongs to a persistent browser."""
+        try:
+            if self.persistent_browser:
+                if self.browser:
+                    self.browser.close()  # Disconnects; the CDP browser keeps running
+                    self.browser = None
+                self.context = None
+            elif self.context:
+                self.context.close()
+                self.context = None
+        except Exception as e:
+            print(f"Warning: Cleanup error: {e}")
+    
     def _create_context_from_selenium_session(self, session_data: Dict[str, Any], headless: bool = False) -> Optional[BrowserContext]:
         """Create Playwright context from Selenium session data."""
         try:
@@ -544,9 +655,9 @@ class ProvenBrowser:
                 self.selenium_driver.quit()
                 self.selenium_driver = None
             
-            if self.context:
+            if self.context and not self.persistent_browser:
                 self.context.close()
-                self.context = None
+            self.context = None
             
             if self.browser:
                 self.browser.close()
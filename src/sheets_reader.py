@@ -9,6 +9,9 @@ or CSV fallback for local testing. Includes data validation and CLI interface.
 import os
 import sys
 import csv
+import json
+import time
+import hashlib
 import argparse
 import re
 from pathlib import Path
@@ -24,6 +27,10 @@ try:
 except ImportError:
     GSPREAD_AVAILABLE = False
 
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
 class SheetsReader:
     """
     Handles reading video job data from Google Sheets or CSV fallback.
@@ -48,8 +55,18 @@ class SheetsReader:
     VALID_STATUSES = ["pending", "in_progress", "completed", "failed", "skipped"]
     VALID_VIDEO_GENERATION = ["pending", "completed", "failed", ""]  # Video generation status
     
-    def __init__(self, env_file: Optional[str] = None):
-        """Initialize SheetsReader with environment variables."""
+    # Seconds a Google Sheets read is reused from state/sheets_cache.json
+    SHEETS_CACHE_TTL = 60
+    
+    def __init__(self, env_file: Optional[str] = None, use_cache: bool = True):
+        """
+        Initialize SheetsReader with environment variables.
+        
+        Args:
+            env_file: Optional .env file to load
+            use_cache: Reuse Google Sheets reads younger than SHEETS_CACHE_TTL
+                       (override with the SHEETS_CACHE_TTL env var; 0 disables)
+        """
         # Load environment variables
         if env_file:
             load_dotenv(env_file)
@@ -62,11 +79,17 @@ class SheetsReader:
         
         # Initialize Google Sheets client if available
         self.gspread_client = None
+        self.credentials = None
         self._init_google_sheets()
         
         # Project root for CSV fallback
-        self.project_root = Path(__file__).parent.parent
+        self.project_root = PROJECT_ROOT
         self.csv_fallback_path = self.project_root / "sheets" / "sample_input.csv"
+        
+        # Local cache of validated sheet rows, so back-to-back runs skip the API call
+        self.cache_ttl = float(os.getenv('SHEETS_CACHE_TTL', self.SHEETS_CACHE_TTL))
+        self.use_cache = use_cache and self.cache_ttl > 0
+        self.cache_path = self.project_root / "state" / "sheets_cache.json"
     
     def _init_google_sheets(self):
         """Initialize Google Sheets client if credentials are available."""
@@ -80,8 +103,7 @@ class SheetsReader:
             # Resolve credentials path: allow absolute or project-root relative
             cred_path = self.google_credentials_path
             if not os.path.isabs(cred_path):
-                project_root = Path(__file__).parent.parent
-                cred_path = str((project_root / cred_path).resolve())
+                cred_path = str((PROJECT_ROOT / cred_path).resolve())
             if not os.path.exists(cred_path):
                 print(f"Warning: Google credentials file not found at {cred_path}")
                 return
@@ -92,16 +114,37 @@ class SheetsReader:
                 'https://www.googleapis.com/auth/drive'  # Full drive access
             ]
             
-            credentials = Credentials.from_service_account_file(
+            self.credentials = Credentials.from_service_account_file(
                 cred_path, 
                 scopes=scope
             )
-            self.gspread_client = gspread.authorize(credentials)
+            self.gspread_client = gspread.authorize(self.credentials)
             
         except Exception as e:
             print(f"Warning: Failed to initialize Google Sheets client: {e}")
             self.gspread_client = None
     
+    def ensure_authenticated(self) -> bool:
+        """
+        Fetch the OAuth access token now instead of on the first API call.
+        Safe to run from a background thread while other setup happens.
+        
+        Returns:
+            True if a valid token is available
+        """
+        if not self.credentials:
+            return False
+        if self.credentials.valid:
+            return True
+        
+        try:
+            from google.auth.transport.requests import Request
+            self.credentials.refresh(Request())
+            return True
+        except Exception as e:
+            print(f"Warning: Google Sheets token refresh failed: {e}")
+            return False
+    
     def _parse_duration(self, duration_str: str) -> int:
         """
         Parse duration string (e.g., '30s', '1m', '2m30s') to seconds.
@@ -212,6 +255,47 @@ class SheetsReader:
         
         return validated_row
     
+    def _cache_key(self) -> str:
+        """Cache key for the configured spreadsheet and worksheet."""
+        source = f"{self.google_sheets_id}|{self.google_sheet_name or ''}"
+        return hashlib.sha1(source.encode('utf-8')).hexdigest()
+    
+    def _load_cache(self) -> Dict:
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    def _get_cached_rows(self) -> Optional[List[Dict[str, Union[str, int]]]]:
+        """Return cached rows for this sheet if they are fresh enough."""
+        entry = self._load_cache().get(self._cache_key())
+        if entry and time.time() - entry.get('ts', 0) < self.cache_ttl:
+            return entry['data']
+        return None
+    
+    def _store_cached_rows(self, data: List[Dict[str, Union[str, int]]]):
+        cache = self._load_cache()
+        cache[self._cache_key()] = {'ts': time.time(), 'data': data}
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.cache_path.with_suffix('.json.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(cache, f)
+            os.replace(tmp_path, self.cache_path)
+        except OSError as e:
+            print(f"Warning: Could not write sheets cache: {e}")
+    
+    def invalidate_cache(self):
+        """Forget cached rows for this sheet (call after writing to it)."""
+        cache = self._load_cache()
+        if cache.pop(self._cache_key(), None) is not None:
+            try:
+                with open(self.cache_path, 'w', encoding='utf-8') as f:
+                    json.dump(cache, f)
+            except OSError:
+                pass
+    
     def _read_google_sheets(self) -> List[Dict[str, Union[str, int]]]:
         """
         Read data from Google Sheets.
@@ -225,6 +309,11 @@ class SheetsReader:
         if not self.gspread_client:
             raise Exception("Google Sheets client not initialized")
         
+        if self.use_cache:
+            cached = self._get_cached_rows()
+            if cached is not None:
+                return cached
+        
         try:
             # Open the spreadsheet
             spreadsheet = self.gspread_client.open_by_key(self.google_sheets_id)
@@ -250,6 +339,8 @@ class SheetsReader:
                 except ValueError as e:
                     raise Exception(f"Row {i} validation error: {e}")
             
+            if self.use_cache:
+                self._store_cached_rows(validated_data)
             return validated_data
             
         except Exception as e:
@@ -18,6 +18,9 @@ import threading
 import shutil
 
 
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
 class JobStatus(Enum):
     """Job status enumeration."""
     PENDING = "pending"
@@ -48,6 +51,9 @@ class StateStore:
     DEFAULT_MAX_BACKOFF = 60
     DEFAULT_BACKOFF_MULTIPLIER = 2.0
     
+    # Job updates are appended to jobs.jsonl and folded into jobs.json this often (seconds)
+    JOURNAL_COMPACT_INTERVAL = 3600
+    
     def __init__(self, project_root: Optional[str] = None):
         """
         Initialize state store.
@@ -56,7 +62,7 @@ class StateStore:
             project_root: Project root directory path
         """
         # Set up paths
-        self.project_root = Path(project_root) if project_root else Path(__file__).parent.parent
+        self.project_root = Path(project_root) if project_root else PROJECT_ROOT
         self.state_dir = self.project_root / "state"
         self.config_dir = self.project_root / "config"
         
@@ -66,6 +72,7 @@ class StateStore:
         
         # State files
         self.jobs_file = self.state_dir / "jobs.json"
+        self.jobs_journal = self.state_dir / "jobs.jsonl"
         self.session_file = self.state_dir / "session.json"
         self.settings_file = self.config_dir / "settings.json"
         self.settings_example_file = self.config_dir / "settings.example.json"
@@ -73,6 +80,9 @@ class StateStore:
         # Thread lock for concurrent access
         self._lock = threading.Lock()
         
+        # jobs.json snapshot with the journal replayed on top, loaded once
+        self._jobs_state = None
+        
         # Load configuration
         self.settings = self._load_settings()
         
@@ -193,15 +203,56 @@ class StateStore:
                 print(f"Warning: Could not backup {file_path}: {e}")
     
     def _load_jobs_state(self) -> Dict[str, Any]:
-        """Load jobs state from file."""
+        """Load jobs state: the jobs.json snapshot plus any journaled updates."""
+        if self._jobs_state is not None:
+            return self._jobs_state
+        
         try:
             with self._lock:
                 with open(self.jobs_file, 'r') as f:
-                    return json.load(f)
+                    state = json.load(f)
+                state.setdefault("jobs", {})
+                
+                if self.jobs_journal.exists():
+                    with open(self.jobs_journal, 'rb') as f:
+                        for line in f:
+                            try:
+                                job = json.loads(line)
+                            except ValueError:
+                                continue  # Torn last line from an interrupted write
+                            state["jobs"][job["job_id"]] = job
+                
+                self._jobs_state = state
+                return state
         except Exception as e:
             print(f"Error loading jobs state: {e}")
             return {"metadata": {}, "jobs": {}}
     
+    def _append_job_record(self, job: Dict[str, Any]):
+        """
+        Persist one job entry by appending it to the journal.
+        
+        Each update is a single O_APPEND write, independent of how many jobs
+        the store holds; the journal is folded into jobs.json periodically.
+        """
+        state = self._load_jobs_state()
+        state["jobs"][job["job_id"]] = job
+        
+        record = json.dumps(job).encode('utf-8') + b'\n'
+        with self._lock:
+            fd = os.open(self.jobs_journal, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                os.write(fd, record)
+            finally:
+                os.close(fd)
+        
+        try:
+            snapshot_age = time.time() - self.jobs_file.stat().st_mtime
+        except OSError:
+            snapshot_age = self.JOURNAL_COMPACT_INTERVAL
+        if snapshot_age >= self.JOURNAL_COMPACT_INTERVAL:
+            self._save_jobs_state(state)
+    
     def _save_jobs_state(self, state: Dict[str, Any]):
         """Save jobs state to file."""
         try:
@@ -216,6 +267,10 @@ class StateStore:
                 # Save to file
                 with open(self.jobs_file, 'w') as f:
                     json.dump(state, f, indent=2)
+                
+                # Everything journaled so far is now in the snapshot
+                if self.jobs_journal.exists():
+                    self.jobs_journal.unlink()
                     
         except Exception as e:
             print(f"Error saving jobs state: {e}")
@@ -259,8 +314,6 @@ class StateStore:
             True if job added successfully
         """
         try:
-            state = self._load_jobs_state()
-            
             job_entry = {
                 "job_id": job_id,
                 "job_data": job_data,
@@ -277,8 +330,7 @@ class StateStore:
                 "export_metadata": None
             }
             
-            state["jobs"][job_id] = job_entry
-            self._save_jobs_state(state)
+            self._append_job_record(job_entry)
             
             return True
             
@@ -341,7 +393,7 @@ class StateStore:
                     "data": diagnostics
                 })
             
-            self._save_jobs_state(state)
+            self._append_job_record(job)
             return True
             
         except Exception as e:
@@ -12,6 +12,9 @@ from typing import Optional
 from playwright.sync_api import Page, BrowserContext
 
 
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
 class VideoDownloader:
     """
     Handles downloading exported videos from CapCut My Cloud.
@@ -28,7 +31,7 @@ class VideoDownloader:
         Args:
             download_dir: Directory to save downloaded videos (default: project_root/downloads)
         """
-        self.project_root = Path(__file__).parent.parent
+        self.project_root = PROJECT_ROOT
         self.download_dir = download_dir or (self.project_root / "downloads")
         self.download_dir.mkdir(exist_ok=True)
         
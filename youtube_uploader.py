@@ -11,11 +11,6 @@ from pathlib import Path
 from typing import Optional, Dict
 import logging
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
 try:
@@ -332,7 +327,7 @@ def auto_detect_latest_edited_video(edited_dir: str = "edited") -> Optional[str]
     return str(latest_video)
 
 
-def main():
+def main(argv=None):
     """Main entry point"""
     parser = argparse.ArgumentParser(description='Upload video to YouTube')
     parser.add_argument('--video', help='Path to video file (or AUTO to auto-detect latest)')
@@ -344,7 +339,7 @@ def main():
     parser.add_argument('--credentials', default='youtube_credentials.json', 
                         help='Path to YouTube API credentials JSON')
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     # Auto-detect video if not provided or if AUTO specified
     if not args.video or args.video.upper() == 'AUTO':
@@ -398,4 +393,9 @@ def main():
 
 
 if __name__ == '__main__':
+    # Configure logging (only when run as a script, not when imported)
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s'
+    )
     exit(main())